@@ -1,18 +1,41 @@
 from __future__ import annotations
 from typing import (Dict, List, Tuple, NoReturn, Union, Literal, TypeAlias, Optional, Final, overload, get_args)
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from threading import RLock
+from itertools import product
+from threading import Lock, RLock
+from time import perf_counter
+from types import MappingProxyType
+import hashlib
+import io
+import mmap
+import os
+import struct
+import weakref
+import zipfile
+import zlib
 import pygame
 
+try:
+    import numpy as np
+except ImportError:    # numpy is only required by AnimationSystem
+    np = None
+
 PlayMode: TypeAlias = Literal["loop", "once", "pingpong"]
+CachePolicyName: TypeAlias = Literal["lru", "lfu", "arc", "clock"]
 Direction: TypeAlias = Tuple[bool, bool]    # (flip_x, flip_y)
 Scale: TypeAlias = Tuple[int, int]    # (width, height)
+SheetRect: TypeAlias = Union[pygame.Rect, Tuple[int, int, int, int]]    # (x, y, width, height)
 
-FramesDict: TypeAlias = Dict[str, List[Union[str, pygame.Surface]]]
+Frame: TypeAlias = Union[str, pygame.Surface]    # image resource name or the image itself
+FramesDict: TypeAlias = Dict[str, List[Frame]]
 FramesTimesDict: TypeAlias = Dict[str, float]
+CacheKey: TypeAlias = Tuple[Frame, Scale, Direction, float]    # (frame, scale, direction, angle)
+PrewarmReport: TypeAlias = Dict[str, int]    # {"surfaces": produced surfaces count, "bytes": produced bytes}
+CacheInfo: TypeAlias = Dict[str, Union[int, float, str, List[CacheKey], Dict[str, int]]]
 
 class AbstractAnimationPlayer(ABC, pygame.sprite.Sprite):
     """animator abstract base class, define unified interface for all"""
@@ -95,9 +118,83 @@ class DefaultLogger(AbstractLogger):
     def critical(self, message: str) -> None:
         print(f"[CRITICAL] {message}")
 
+class ImageProvider(ABC):
+    """Provide frame images by resource name on demand, instead of a fully populated dict.
+    
+    Images are only requested when the frame cache of a player misses them,
+    and each player keeps the image it got for the frame.
+    """
+
+    @abstractmethod
+    def get_image(self, name: str) -> pygame.Surface:
+        """Return the image of the resource name
+
+        Raises:
+            KeyError: Unknown resource name
+            pygame.error: The image cannot be decoded
+        """
+        pass
+
+    def __contains__(self, name: str) -> bool:
+        """Whether the resource name is provided, frames which are not are loaded as image files"""
+        return True
+
+class CallableImageProvider(ImageProvider):
+    """Provide images with a loader function, every resource name is delegated to it"""
+
+    def __init__(self, loader: Callable[[str], pygame.Surface]) -> None:
+        self._loader = loader
+
+    def get_image(self, name: str) -> pygame.Surface:
+        return self._loader(name)
+
+class ZipImageProvider(ImageProvider):
+    """Provide the image members of a zip archive, decoded on first request and shared
+    by every player using the provider. Resource names are the member names."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Raises:
+            FileNotFoundError: File not found
+            zipfile.BadZipFile: Not a zip archive
+        """
+        self._archive = zipfile.ZipFile(path)
+        self._names = set(self._archive.namelist())
+        self._images: Dict[str, pygame.Surface] = {}
+        self._lock = Lock()    # ZipFile reads are not thread safe
+
+    def get_image(self, name: str) -> pygame.Surface:
+        if name not in self._names:
+            raise KeyError(f"Invalid image resource: {name}")
+        with self._lock:
+            if name not in self._images:
+                self._images[name] = pygame.image.load(
+                    io.BytesIO(self._archive.read(name)), name
+                )
+            return self._images[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def close(self) -> None:
+        """Close the archive, the decoded images stay usable"""
+        with self._lock:
+            self._archive.close()
+
 
 class _AnimationMagicNumber:
     DEFAULT_MAX_CHACH_SIZE: Final[int] = 200
+    DEFAULT_MAX_CACHE_BYTES: Final[int] = 0    # 0 means no memory budget
+    DEFAULT_ANGLE_STEP: Final[float] = 0.0    # 0 means no angle quantization
+    DEFAULT_CACHE_POLICY: Final[CachePolicyName] = "lru"
+    MISS_TIME_BUCKETS_MS: Final[Tuple[float, ...]] = (0.1, 0.5, 1, 2, 5, 10, 20, 50)    # upper bounds of the histogram
+    DEFAULT_COLD_CACHE_BYTES: Final[int] = 0    # 0 disables the compressed cold tier
+    DEFAULT_LOAD_WORKERS: Final[int] = 4    # 1 loads the image files sequentially
+    DEFAULT_STATE_IDLE_TIMEOUT: Final[float] = 0.0    # 0 never unloads idle lazy states
+    OPAQUE_ALPHA_THRESHOLD: Final[int] = 254    # pixels with a greater alpha count as opaque
+    COLD_CACHE_COMPRESS_LEVEL: Final[int] = 1    # favour speed, pixel art still compresses well
+    HIT_BUFFER_SIZE: Final[int] = 64    # buffered lock free hits before they are replayed into the eviction policy
+    SHARED_CACHE_STRIPES: Final[int] = 16
     ORIGINAL_IMAGE_FRAME_SCALE: Final[Scale] = (0, 0)
     DEFAULT_PLAY_MODE: Final[PlayMode] = "loop"
     CACHE_MIN_SIZE: Final[int] = 10
@@ -118,50 +215,751 @@ class _AnimationMagicNumber:
     def __delattr__(self, name) -> NoReturn:
         raise AttributeError(f"Cannot delete immutable attribute '{name}'")
 
+SharedCacheKey: TypeAlias = Tuple[int, Scale, Direction, float, bool]    # (id(source image), scale, direction, angle, display format)
+
+class _SharedCacheStripe:
+    """One independently locked part of `_SharedFrameCache`"""
+
+    __slots__ = ("lock", "entries", "refcounts", "pending")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # key -> (source image, transformed image), the source is kept alive so its id() can not be reused
+        self.entries: Dict[SharedCacheKey, Tuple[pygame.Surface, pygame.Surface]] = {}
+        self.refcounts: Dict[SharedCacheKey, int] = {}
+        self.pending: Dict[SharedCacheKey, Lock] = {}    # keys being produced -> their production lock
+
+class _SharedFrameCache:
+    """A process-wide, reference-counted store of transformed frames.
+
+    Every `FramePlayer` created with `AnimationConfig.shared_cache=True` looks its
+    transformed frames up here, so players using the same source images with the same
+    transform share one surface instead of holding private copies. An entry lives as
+    long as at least one player references it.
+
+    Keys are spread over independently locked stripes, and a missing entry is produced
+    outside of its stripe lock (only other acquirers of the same key wait for it),
+    so players on different threads rarely contend.
+    """
+
+    __slots__ = ("_stripes",)
+
+    def __init__(self) -> None:
+        self._stripes = tuple(
+            _SharedCacheStripe() 
+            for _ in range(_AnimationMagicNumber.SHARED_CACHE_STRIPES)
+        )
+
+    @staticmethod
+    def make_key(source: pygame.Surface,
+                 scale: Scale,
+                 direction: Direction,
+                 angle: float,
+                 display_format: bool = False) -> SharedCacheKey:
+        """Generate the shared cache key of a transformed source image,
+        display_format tells the images produced from the display format copy of the source apart"""
+        return id(source), scale, direction, angle, display_format
+
+    def _stripe(self, key: SharedCacheKey) -> _SharedCacheStripe:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def acquire(self,
+                key: SharedCacheKey,
+                source: pygame.Surface,
+                factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Return the transformed image of the key and add a reference to it
+
+        Args:
+            key: Shared cache key, see `make_key`
+            source: Source image of the key
+            factory: Produce the transformed image on a miss
+
+        Raises:
+            Exception: Anything raised by factory, no reference is added in this case
+        """
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if key in stripe.entries:
+                stripe.refcounts[key] += 1
+                return stripe.entries[key][1]
+            production_lock = stripe.pending.setdefault(key, Lock())
+
+        with production_lock:
+            with stripe.lock:
+                if key in stripe.entries:    # produced by another thread meanwhile
+                    stripe.refcounts[key] += 1
+                    return stripe.entries[key][1]
+            try:
+                img = factory()
+            except BaseException:
+                with stripe.lock:
+                    stripe.pending.pop(key, None)
+                raise
+            with stripe.lock:
+                stripe.entries[key] = (source, img)
+                stripe.refcounts[key] = 1
+                stripe.pending.pop(key, None)
+            return img
+
+    def release(self, key: SharedCacheKey) -> None:
+        """Drop one reference of the key, the entry is removed with its last reference"""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            count = stripe.refcounts.get(key, 0) - 1
+            if count > 0:
+                stripe.refcounts[key] = count
+                return
+            stripe.refcounts.pop(key, None)
+            stripe.entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
+
+    @property
+    def references(self) -> int:
+        """Return the total number of references held by all players"""
+        total = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                total += sum(stripe.refcounts.values())
+        return total
+
+_shared_frame_cache = _SharedFrameCache()
+
+class _CachePolicy(ABC):
+    """cache eviction policy abstract base class, tracks the resident keys of a
+    `_FrameCacheManager` and decides which one to eliminate.
+
+    The cache manager calls `miss` when a key is not resident, `evict` as long as the
+    cache is full, then `insert` for the missed key.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def hit(self, key: Hashable) -> None:
+        """A resident key has been accessed"""
+        pass
+
+    def miss(self, key: Hashable) -> None:
+        """A non-resident key has been accessed, called before any eviction"""
+        pass
+
+    @abstractmethod
+    def insert(self, key: Hashable) -> None:
+        """The missed key became resident"""
+        pass
+
+    @abstractmethod
+    def evict(self) -> Hashable:
+        """Choose, forget and return the resident key to eliminate"""
+        pass
+
+    @abstractmethod
+    def remove(self, key: Hashable) -> None:
+        """A resident key has been removed explicitly"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all keys"""
+        pass
+
+    def resize(self, capacity: int) -> None:
+        """The maximum number of resident keys has changed"""
+        pass
+
+class _LRUPolicy(_CachePolicy):
+    """Least recently used"""
+
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: OrderedDict = OrderedDict()
+
+    def hit(self, key: Hashable) -> None:
+        self._keys.move_to_end(key)
+
+    def insert(self, key: Hashable) -> None:
+        self._keys[key] = None
+
+    def evict(self) -> Hashable:
+        return self._keys.popitem(last=False)[0]
+
+    def remove(self, key: Hashable) -> None:
+        self._keys.pop(key, None)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+class _LFUPolicy(_CachePolicy):
+    """Least frequently used, ties are broken by least recently used"""
+
+    __slots__ = ("_counts", "_buckets")
+
+    def __init__(self) -> None:
+        self._counts: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, OrderedDict] = {}    # access count -> keys in LRU order
+
+    def _unlink(self, key: Hashable) -> int:
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+        return count
+
+    def _link(self, key: Hashable, count: int) -> None:
+        self._counts[key] = count
+        self._buckets.setdefault(count, OrderedDict())[key] = None
+
+    def hit(self, key: Hashable) -> None:
+        self._link(key, self._unlink(key) + 1)
+
+    def insert(self, key: Hashable) -> None:
+        self._link(key, 1)
+
+    def evict(self) -> Hashable:
+        key = next(iter(self._buckets[min(self._buckets)]))
+        self._unlink(key)
+        return key
+
+    def remove(self, key: Hashable) -> None:
+        if key in self._counts:
+            self._unlink(key)
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+
+class _ARCPolicy(_CachePolicy):
+    """Adaptive replacement cache (Megiddo & Modha), scan resistant.
+
+    Resident keys are split into recency (t1) and frequency (t2) lists, and the ghost
+    lists (b1, b2) of recently evicted keys adapt the target size of t1.
+    """
+
+    __slots__ = ("_t1", "_t2", "_b1", "_b2", "_target", "_capacity", "_ghost_hit_b2")
+
+    def __init__(self) -> None:
+        self._t1: OrderedDict = OrderedDict()
+        self._t2: OrderedDict = OrderedDict()
+        self._b1: OrderedDict = OrderedDict()
+        self._b2: OrderedDict = OrderedDict()
+        self._target: float = 0
+        self._capacity: int = _AnimationMagicNumber.DEFAULT_MAX_CHACH_SIZE
+        self._ghost_hit_b2 = False
+
+    def hit(self, key: Hashable) -> None:
+        self._t1.pop(key, None)
+        self._t2[key] = None
+        self._t2.move_to_end(key)
+
+    def miss(self, key: Hashable) -> None:
+        self._ghost_hit_b2 = key in self._b2
+        if key in self._b1:
+            delta = max(len(self._b2) / len(self._b1), 1)
+            self._target = min(self._capacity, self._target + delta)
+        elif key in self._b2:
+            delta = max(len(self._b1) / len(self._b2), 1)
+            self._target = max(0, self._target - delta)
+
+    def insert(self, key: Hashable) -> None:
+        if key in self._b1 or key in self._b2:
+            self._b1.pop(key, None)
+            self._b2.pop(key, None)
+            self._t2[key] = None
+        else:
+            self._t1[key] = None
+        # Keep the directory (resident + ghost keys) within 2 * capacity
+        while self._b1 and len(self._t1) + len(self._b1) > self._capacity:
+            self._b1.popitem(last=False)
+        while self._b2 and (len(self._t1) + len(self._t2) + 
+                            len(self._b1) + len(self._b2)) > 2 * self._capacity:
+            self._b2.popitem(last=False)
+
+    def evict(self) -> Hashable:
+        if self._t1 and (
+            len(self._t1) > self._target or
+            (len(self._t1) == self._target and self._ghost_hit_b2) or
+            not self._t2
+        ):
+            key = self._t1.popitem(last=False)[0]
+            self._b1[key] = None
+        else:
+            key = self._t2.popitem(last=False)[0]
+            self._b2[key] = None
+        return key
+
+    def remove(self, key: Hashable) -> None:
+        self._t1.pop(key, None)
+        self._t2.pop(key, None)
+
+    def clear(self) -> None:
+        for keys in (self._t1, self._t2, self._b1, self._b2):
+            keys.clear()
+        self._target = 0
+
+    def resize(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._target = min(self._target, capacity)
+
+class _ClockPolicy(_CachePolicy):
+    """CLOCK (second chance), an approximation of LRU whose hits only set a reference bit"""
+
+    __slots__ = ("_ring",)
+
+    def __init__(self) -> None:
+        self._ring: OrderedDict = OrderedDict()    # key -> reference bit, the front is the clock hand
+
+    def hit(self, key: Hashable) -> None:
+        self._ring[key] = True
+
+    def insert(self, key: Hashable) -> None:
+        self._ring[key] = False
+
+    def evict(self) -> Hashable:
+        while True:
+            key, referenced = self._ring.popitem(last=False)
+            if not referenced:
+                return key
+            self._ring[key] = False    # second chance
+
+    def remove(self, key: Hashable) -> None:
+        self._ring.pop(key, None)
+
+    def clear(self) -> None:
+        self._ring.clear()
+
+_CACHE_POLICIES: Final[Dict[CachePolicyName, Callable[[], _CachePolicy]]] = {
+    "lru": _LRUPolicy,
+    "lfu": _LFUPolicy,
+    "arc": _ARCPolicy,
+    "clock": _ClockPolicy,
+}
+
+class _CacheStats:
+    """Counters of a `_FrameCacheManager`: hits, misses, evictions, load errors and a 
+    histogram of the time spent producing images on misses"""
+
+    __slots__ = (
+        "hits", "misses", "cold_hits", "evictions", "load_errors", "miss_time", "_miss_time_buckets"
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero"""
+        self.hits: int = 0
+        self.misses: int = 0
+        self.cold_hits: int = 0    # misses served by the compressed cold tier
+        self.evictions: int = 0
+        self.load_errors: int = 0
+        self.miss_time: float = 0.0    # in seconds
+        self._miss_time_buckets: List[int] = [0] * (len(_AnimationMagicNumber.MISS_TIME_BUCKETS_MS) + 1)
+
+    def record_miss_time(self, seconds: float) -> None:
+        """Record the time spent processing the image of a miss"""
+        self.miss_time += seconds
+        milliseconds = seconds * 1000
+        for i, bound in enumerate(_AnimationMagicNumber.MISS_TIME_BUCKETS_MS):
+            if milliseconds <= bound:
+                self._miss_time_buckets[i] += 1
+                return
+        self._miss_time_buckets[-1] += 1
+
+    @property
+    def hit_ratio(self) -> float:
+        accesses = self.hits + self.misses
+        return self.hits / accesses if accesses else 0.0
+
+    @property
+    def miss_time_histogram(self) -> Dict[str, int]:
+        """Return the miss time histogram, {"<=1ms": count, ..., ">50ms": count}"""
+        bounds = _AnimationMagicNumber.MISS_TIME_BUCKETS_MS
+        histogram = {
+            f"<={bound}ms": count 
+            for bound, count in zip(bounds, self._miss_time_buckets)
+        }
+        histogram[f">{bounds[-1]}ms"] = self._miss_time_buckets[-1]
+        return histogram
+
+# magic, width, height, has alpha, has colorkey, colorkey (r, g, b)
+_SURFACE_BLOB_HEADER: Final[struct.Struct] = struct.Struct("<4sIIBB3B")
+_SURFACE_BLOB_MAGIC: Final[bytes] = b"PFAF"
+
+def _pack_surface(surface: pygame.Surface) -> bytes:
+    """Serialize the surface to a raw pixel blob (header + RGB(A) pixels)"""
+    has_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    colorkey = surface.get_colorkey()
+    header = _SURFACE_BLOB_HEADER.pack(
+        _SURFACE_BLOB_MAGIC, *surface.get_size(), has_alpha, colorkey is not None,
+        *(colorkey[:3] if colorkey is not None else (0, 0, 0))
+    )
+    return header + pygame.image.tobytes(surface, "RGBA" if has_alpha else "RGB")
+
+def _unpack_surface(data: Union[bytes, memoryview], copy: bool = True) -> pygame.Surface:
+    """Deserialize a raw pixel blob made by `_pack_surface`
+
+    Args:
+        data: The blob
+        copy: Copy the pixels to a bytearray, otherwise the surface is a view of data
+
+    Raises:
+        ValueError: Not a valid blob
+    """
+    try:
+        magic, width, height, has_alpha, has_colorkey, *colorkey = \
+            _SURFACE_BLOB_HEADER.unpack_from(data)
+        if magic != _SURFACE_BLOB_MAGIC:
+            raise ValueError("bad magic")
+        pixels = memoryview(data)[_SURFACE_BLOB_HEADER.size:]
+        # bytearray keeps the pixels writable, the surface references it without copying
+        surface = pygame.image.frombuffer(
+            bytearray(pixels) if copy else pixels, 
+            (width, height), 
+            "RGBA" if has_alpha else "RGB"
+        )
+    except (struct.error, pygame.error) as error:
+        raise ValueError(str(error)) from error
+    if has_colorkey:
+        surface.set_colorkey(tuple(colorkey))
+    return surface
+
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert the surface to the display pixel format (a display mode must be set)
+
+    Surfaces without transparent pixels use `convert()`, which blits faster than `convert_alpha()`
+    """
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert()
+    
+    width, height = surface.get_size()
+    opaque_pixels = pygame.mask.from_surface(
+        surface, _AnimationMagicNumber.OPAQUE_ALPHA_THRESHOLD
+    ).count()
+    if opaque_pixels == width * height:
+        return surface.convert()
+    return surface.convert_alpha()
+
+class _DisplayFormatSurfaces:
+    """Process-wide display format copies of source images, keyed by the source object.
+
+    Players converting the same source (e.g. an image of the `_image_registry`) share one
+    converted copy instead of converting it each, an entry is dropped with its source.
+    """
+
+    __slots__ = ("_lock", "_converted")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._converted: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()    # source -> converted
+
+    def get(self, source: pygame.Surface) -> pygame.Surface:
+        """Return the display format copy of the source, converting it on first use (a display mode must be set)"""
+        with self._lock:
+            converted = self._converted.get(source)
+        if converted is not None:
+            return converted
+        
+        converted = _to_display_format(source)
+        with self._lock:
+            return self._converted.setdefault(source, converted)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._converted)
+
+_display_surfaces = _DisplayFormatSurfaces()
+
+def _pixel_digest(surface: pygame.Surface) -> bytes:
+    """Hash the pixel content of the surface (size, alpha, colorkey and pixels)"""
+    return hashlib.sha1(_pack_surface(surface)).digest()
+
+# magic, version, states count
+_BUNDLE_HEADER: Final[struct.Struct] = struct.Struct("<4sHI")
+_BUNDLE_MAGIC: Final[bytes] = b"PFAB"
+_BUNDLE_VERSION: Final[int] = 1
+# state name length (the utf-8 name follows), frame time, frames count
+_BUNDLE_STATE: Final[struct.Struct] = struct.Struct("<HdI")
+# offset and length of the frame pixel block (a `_pack_surface` blob)
+_BUNDLE_FRAME: Final[struct.Struct] = struct.Struct("<QQ")
+
+class _DiskFrameCache:
+    """A persistent cache of transformed frames, stored as raw pixel blobs in a directory.
+
+    Blobs are keyed by the content hash of the source file plus the transform parameters,
+    so they stay valid across runs and are never served for a changed source file.
+    The directory is never cleaned up automatically.
+    """
+
+    __slots__ = ("_directory", "_logger")
+
+    def __init__(self, directory: str, logger: AbstractLogger) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._logger = logger
+
+    @staticmethod
+    def hash_source(data: bytes) -> str:
+        """Return the content hash of a source file"""
+        return hashlib.sha1(data).hexdigest()
+
+    @staticmethod
+    def make_key(source_hash: str, 
+                 scale: Scale, 
+                 direction: Direction, 
+                 angle: float) -> str:
+        """Generate the blob name of a transformed source file"""
+        params = f"{source_hash}|{scale}|{direction}|{angle!r}"
+        return hashlib.sha1(params.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.frame")
+
+    def load(self, key: str) -> Optional[pygame.Surface]:
+        """Return the stored frame of the key, or None if it is not stored (or unreadable)"""
+        try:
+            with open(self._path(key), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        except OSError as error:
+            self._logger.warning(f"Disk cache read failed: {key} - {error}")
+            return None
+
+        try:
+            return _unpack_surface(data)
+        except ValueError as error:
+            self._logger.warning(f"Disk cache entry corrupted, ignored: {key} - {error}")
+            return None
+
+    def store(self, key: str, surface: pygame.Surface) -> None:
+        """Store the frame of the key, failures are only logged"""
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(_pack_surface(surface))
+            os.replace(temp_path, path)    # atomic, readers never see a partial blob
+        except OSError as error:
+            self._logger.warning(f"Disk cache write failed: {key} - {error}")
+
+def _load_image_file(path: str, hash_source: bool = False) -> Tuple[pygame.Surface, Optional[str]]:
+    """Load an image file, and its content hash if required
+
+    Raises:
+        pygame.error: Unsupported or corrupted image
+        FileNotFoundError: File not found
+    """
+    if not hash_source:
+        return pygame.image.load(path), None
+    
+    with open(path, "rb") as file:
+        data = file.read()
+    return pygame.image.load(io.BytesIO(data), path), _DiskFrameCache.hash_source(data)
+
+class _ImageRegistry:
+    """A process-wide, reference-counted store of decoded image files.
+
+    Players created with `AnimationConfig.shared_images=True` (default) get their image
+    files here, so players of the same files decode each file once and share its pixels.
+    An entry is evicted with the release of its last reference.
+    """
+
+    __slots__ = ("_lock", "_entries", "_refcounts", "_pending")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        # path -> (image, content hash or None, modification time in ns when loaded)
+        self._entries: Dict[str, Tuple[pygame.Surface, Optional[str], int]] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._pending: Dict[str, Lock] = {}    # paths being loaded -> their loading lock
+
+    def _add_reference(self, path: str, hash_source: bool) -> Optional[Tuple[pygame.Surface, Optional[str], int]]:
+        """Add a reference to a loaded entry, the lock must be held"""
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        if hash_source and entry[1] is None:
+            with open(path, "rb") as file:
+                entry = self._entries[path] = (entry[0], _DiskFrameCache.hash_source(file.read()), entry[2])
+        self._refcounts[path] += 1
+        return entry
+
+    def acquire_loaded(self, path: str, hash_source: bool = False) -> Optional[Tuple[pygame.Surface, Optional[str], int]]:
+        """Add a reference to the file and return its entry if it is loaded, None (no reference added) otherwise
+
+        Raises:
+            OSError: The loaded file could not be read to hash it, no reference is added
+        """
+        with self._lock:
+            return self._add_reference(path, hash_source)
+
+    def acquire(self, path: str, hash_source: bool = False) -> Tuple[pygame.Surface, Optional[str], int]:
+        """Return (image, content hash, modification time) of the file and add a reference,
+        the file is only loaded if no player holds it
+
+        Raises:
+            pygame.error: Unsupported or corrupted image
+            FileNotFoundError: File not found, no reference is added in both cases
+        """
+        with self._lock:
+            entry = self._add_reference(path, hash_source)
+            if entry is not None:
+                return entry
+            loading_lock = self._pending.setdefault(path, Lock())
+
+        with loading_lock:
+            with self._lock:
+                entry = self._add_reference(path, hash_source)    # loaded by another thread meanwhile
+                if entry is not None:
+                    return entry
+            try:
+                mtime = os.stat(path).st_mtime_ns    # before reading, a write during the load is seen as a change
+                entry = (*_load_image_file(path, hash_source), mtime)
+            except BaseException:
+                with self._lock:
+                    self._pending.pop(path, None)
+                raise
+            with self._lock:
+                self._entries[path] = entry
+                self._refcounts[path] = 1
+                self._pending.pop(path, None)
+            return entry
+
+    def reload(self, path: str, seen_mtime: int, hash_source: bool = False) -> Tuple[pygame.Surface, Optional[str], int]:
+        """Return the entry of a file modified since seen_mtime, the file is only
+        loaded again if no other player has reloaded it yet (the reference is kept)
+
+        Raises:
+            pygame.error: Unsupported or corrupted image
+            OSError: File not readable
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[2] != seen_mtime:
+            return entry
+        
+        mtime = os.stat(path).st_mtime_ns
+        entry = (*_load_image_file(path, hash_source), mtime)
+        with self._lock:
+            if path in self._entries:
+                self._entries[path] = entry
+        return entry
+
+    def release(self, path: str) -> None:
+        """Drop one reference of the file, the entry is evicted with its last reference"""
+        with self._lock:
+            count = self._refcounts.get(path, 0) - 1
+            if count > 0:
+                self._refcounts[path] = count
+                return
+            self._refcounts.pop(path, None)
+            self._entries.pop(path, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_image_registry = _ImageRegistry()
+
+
+class _NullLock:
+    """A lock doing nothing, used in place of real locks by single-threaded players"""
+
+    __slots__ = ()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+    def __enter__(self) -> bool:
+        return True
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
 @dataclass
 class _CacheManagerDeps:
     max_cache_size: int
+    max_cache_bytes: int
+    cache_policy: CachePolicyName
+    max_cold_bytes: int
     get_scale: Callable[[], Scale]
     get_direction: Callable[[], Direction]
-    process_image: Callable[[str], pygame.Surface]
+    get_angle: Callable[[], float]
+    get_source_image: Callable[[Frame], pygame.Surface]
+    process_image: Callable[
+        [Frame, Scale, Direction, float, Optional[Callable[[], pygame.Surface]]], pygame.Surface
+    ]
+    transform_image: Callable[[pygame.Surface, Scale, Direction, float], pygame.Surface]
     create_error_surface: Callable[[], pygame.Surface]
-    surface_frames: Callable[[], bool]
     logger: AbstractLogger
+    shared_cache: Optional[_SharedFrameCache] = None
+    single_threaded: bool = False
+    normalize_image: Optional[Callable[[pygame.Surface], pygame.Surface]] = None    # applied to unpacked cold images
+    get_shared_source: Optional[Callable[[Frame], pygame.Surface]] = None    # identifies the frame in the shared cache
+    get_display_format: Optional[Callable[[], bool]] = None    # whether the sources are display format copies
 
 
 class _FrameCacheManager:
-    """A simple LRU cache for frame images, used by `FramePlayer` to manage frame images
+    """A frame image cache with a pluggable eviction policy (LRU by default), 
+    used by `FramePlayer` to manage frame images
     ## Thread Safety:
-        This implementation uses a reentrant lock (RLock) to ensure thread safety.
-        The choice of RLock over simpler Lock is intentional:
+        The cache is read-optimized, no single lock is held while an image is produced:
         
-        1. Reentrancy Needed: Cache operations might be called through complex
-           callback chains where the same thread could re-enter the cache.
+        1. Lock Free Hits: Reading the cache dict is atomic, so a hit takes no lock.
+           The hit is pushed to a thread safe buffer which is replayed into the eviction 
+           policy under the cache lock, on the next miss or once the buffer is full.
         
-        2. Moderate Performance: Image loading and transformation are relatively
-           expensive operations, so the slight overhead of RLock is negligible
-           compared to the image processing time.
+        2. Per Key Misses: A miss only locks its own key while the image is loaded and
+           transformed, so threads missing different keys process images concurrently,
+           and threads missing the same key wait for a single production.
         
-        3. Future Optimization Ready: If profiling identifies this as a bottleneck,
-           the implementation can be easily replaced with a more concurrent solution
-           without changing the public interface.
+        3. Short Bookkeeping: The reentrant cache lock (RLock) only guards the policy,
+           byte accounting, eviction and the cold tier, which are cheap operations.
+        
+        With `_CacheManagerDeps.single_threaded` every lock is replaced by a `_NullLock`
+        and hits update the policy directly, the cache must then only be used by one thread.
     """
 
     __slots__ = (
-        "_deps", "_cache_lock", "_image_cache", "_max_cache_size"
+        "_deps", "_cache_lock", "_image_cache", "_max_cache_size", "_shared_keys",
+        "_max_cache_bytes", "_cache_bytes", "_entry_bytes", "_policy", "_stats",
+        "_cold_cache", "_cold_bytes", "_max_cold_bytes", "_hit_buffer", "_miss_locks",
+        "_single_threaded", "_inserted"
     )
 
     def __init__(self, deps: _CacheManagerDeps) -> None:
-        self._cache_lock = RLock()    # Cache lock to prevent multiple threads (such as online) from accessing the cache simultaneously
-        self._image_cache: OrderedDict = OrderedDict()
+        self._single_threaded = deps.single_threaded
+        self._cache_lock = _NullLock() if deps.single_threaded else RLock()    # Cache lock to prevent multiple threads (such as online) from accessing the cache simultaneously
+        self._image_cache: Dict[CacheKey, pygame.Surface] = {}
         self._max_cache_size = deps.max_cache_size
+        self._policy = _CACHE_POLICIES[deps.cache_policy]()
+        self._policy.resize(deps.max_cache_size)
         self._deps = deps
-
-    def get_cached_image(self, frame_name: str) -> pygame.Surface:
+        self._shared_keys: Dict[tuple, SharedCacheKey] = {}    # local cache key -> shared cache key
+        self._max_cache_bytes = deps.max_cache_bytes
+        self._cache_bytes = 0
+        self._entry_bytes: Dict[tuple, int] = {}
+        self._stats = _CacheStats()
+        # Second tier of evicted frames, kept as zlib compressed pixel blobs in LRU order
+        self._cold_cache: OrderedDict = OrderedDict()
+        self._cold_bytes = 0
+        self._max_cold_bytes = deps.max_cold_bytes
+        self._hit_buffer: deque = deque()    # lock free hits waiting to be replayed into the policy
+        self._miss_locks: Dict[CacheKey, List] = {}    # key being produced -> [lock, waiters count]
+        self._inserted = [0, 0]    # images inserted since creation -> [count, bytes], never reset
+
+    def get_cached_image(self, frame: Frame) -> pygame.Surface:
         """Retrieve processed images (thread safe with cached)
         
         Args:
-            frame_name: Original image resource name
+            frame: Original image resource name, or the original Surface when using Surface as a frame
             
         Returns:
             processed pygame.Surface
@@ -169,47 +967,274 @@ class _FrameCacheManager:
         Raises:
             pygame.error: process image failed
             KeyError: frame name not found
-            ValueError: Call this method when using Surface as a frame
         """
-        if self._deps.surface_frames():
-            raise ValueError(
-                "This method shouldn't be called when using Surface as a frame"
+        return self._get_image(self._get_cache_key(frame))
+
+    def get_image(self, 
+                  frame: Frame, 
+                  scale: Scale, 
+                  direction: Direction, 
+                  angle: float) -> pygame.Surface:
+        """Retrieve the processed image of the frame with an explicit transform,
+        for players sharing the cache (see `AnimationClip`), see `get_cached_image`"""
+        return self._get_image((frame, scale, direction, angle))
+
+    def prewarm(self, 
+                frame: Frame, 
+                scale: Scale, 
+                direction: Direction, 
+                angle: float) -> Tuple[int, int]:
+        """Process and cache the frame with the given transform ahead of time
+
+        Returns:
+            (count, bytes) of the images inserted into the cache, the intermediate pipeline stages
+            (scaled, flipped) included, (0, 0) if it was already cached or could not be cached
+        """
+        cache_key = (frame, scale, direction, angle)
+        if cache_key in self._image_cache:
+            return 0, 0
+        count, nbytes = self._inserted
+        self._get_image(cache_key)
+        return self._inserted[0] - count, self._inserted[1] - nbytes
+
+    def _get_image(self, cache_key: CacheKey) -> pygame.Surface:
+        """Retrieve the processed image of the cache key, see `get_cached_image`"""
+        try:
+            return self._fetch(cache_key)
+        except (pygame.error, KeyError) as errors:
+            with self._cache_lock:
+                self._stats.load_errors += 1
+            self._deps.logger.error(
+                f"Image processing failed: {cache_key[0]} - {str(errors)}"
             )
+            return self._deps.create_error_surface()
+
+    def _fetch(self, cache_key: CacheKey, counted: bool = True) -> pygame.Surface:
+        """Retrieve the processed image of the cache key, loading and caching it on a miss
+
+        Args:
+            cache_key: Cache key
+            counted: Count the lookup in the hit/miss stats, False for the intermediate
+                pipeline stages looked up while producing another image
 
-        cache_key = self._get_cache_key(frame_name)
+        Raises:
+            pygame.error: process image failed
+            KeyError: frame name not found
+        """
+        # cache hit, lock free
+        img = self._image_cache.get(cache_key)
+        if img is not None:
+            self._record_hit(cache_key, counted)
+            return img
         
+        if self._single_threaded:
+            return self._miss(cache_key, counted)
+        
+        # cache miss -> load new surface, only this key is locked meanwhile
+        miss_lock = self._acquire_miss_lock(cache_key)
+        try:
+            img = self._image_cache.get(cache_key)
+            if img is not None:    # produced by another thread meanwhile
+                self._record_hit(cache_key, counted)
+                return img
+            return self._miss(cache_key, counted)
+        finally:
+            self._release_miss_lock(cache_key, miss_lock)
+
+    def _miss(self, cache_key: CacheKey, counted: bool = True) -> pygame.Surface:
+        """Count a miss then load, transform and insert the image of the cache key"""
         with self._cache_lock:
-            # cache hit
-            if cache_key in self._image_cache:
-                self._image_cache.move_to_end(cache_key)  # update LRU cache order
-                return self._image_cache[cache_key]
+            self._drain_hits()
+            self._policy.miss(cache_key)
+            if counted:
+                self._stats.misses += 1
+        return self._insert(cache_key, self._load_image(cache_key, counted))
+
+    def _insert(self, cache_key: CacheKey, img: pygame.Surface) -> pygame.Surface:
+        """Insert a produced image, evicting the caches chosen by the policy"""
+        with self._cache_lock:
+            nbytes = self.surface_bytes(img)
+            if self._max_cache_bytes and nbytes > self._max_cache_bytes:
+                self._release_shared(cache_key)
+                self._deps.logger.warning(
+                    f"Image exceeds the cache memory budget, not cached: {cache_key}"
+                )
+                return img
+            
+            # evict the caches chosen by the policy
+            while self._image_cache and (
+                len(self._image_cache) >= self._max_cache_size or
+                (self._max_cache_bytes and
+                 self._cache_bytes + nbytes > self._max_cache_bytes)
+            ):
+                self._evict()
             
-            # cache miss -> load new surface
+            self._image_cache[cache_key] = img
+            self._policy.insert(cache_key)
+            self._entry_bytes[cache_key] = nbytes
+            self._cache_bytes += nbytes
+            self._inserted[0] += 1
+            self._inserted[1] += nbytes
+            self._deps.logger.info(f"Cached new image: {cache_key}")
+            return img
+
+    def _record_hit(self, cache_key: CacheKey, counted: bool = True) -> None:
+        """Buffer a lock free hit, replaying the buffer if it is full and the lock is free"""
+        if self._single_threaded:
+            self._policy.hit(cache_key)
+            if counted:
+                self._stats.hits += 1
+            return
+        self._hit_buffer.append((cache_key, counted))
+        if (len(self._hit_buffer) >= _AnimationMagicNumber.HIT_BUFFER_SIZE and
+            self._cache_lock.acquire(blocking=False)):
             try:
-                img = self._deps.process_image(frame_name)
-                
-                # evict the oldest unused cache
-                if len(self._image_cache) >= self._max_cache_size:
-                    self._image_cache.popitem(last=False)
-                
-                self._image_cache[cache_key] = img
-                self._deps.logger.info(f"Cached new image: {cache_key}")
-                return img
-            except (pygame.error, KeyError) as errors:
-                self._deps.logger.error(
-                    f"Image processing failed: {frame_name} - {str(errors)}"
-                )
-                return self._deps.create_error_surface()
+                self._drain_hits()
+            finally:
+                self._cache_lock.release()
+
+    def _drain_hits(self) -> None:
+        """Replay the buffered hits into the eviction policy and counters (cache lock held)"""
+        while self._hit_buffer:
+            try:
+                cache_key, counted = self._hit_buffer.popleft()
+            except IndexError:
+                break
+            if counted:
+                self._stats.hits += 1
+            if cache_key in self._image_cache:    # may have been evicted since
+                self._policy.hit(cache_key)
+
+    def _acquire_miss_lock(self, cache_key: CacheKey) -> List:
+        with self._cache_lock:
+            miss_lock = self._miss_locks.get(cache_key)
+            if miss_lock is None:
+                miss_lock = self._miss_locks[cache_key] = [Lock(), 0]
+            miss_lock[1] += 1
+        miss_lock[0].acquire()
+        return miss_lock
+
+    def _release_miss_lock(self, cache_key: CacheKey, miss_lock: List) -> None:
+        miss_lock[0].release()
+        with self._cache_lock:
+            miss_lock[1] -= 1
+            if not miss_lock[1]:
+                del self._miss_locks[cache_key]
             
-    def _get_cache_key(self, frame_name: str) -> Tuple[str, Tuple[int, int], Tuple[bool, bool]]:
+    def _get_cache_key(self, frame: Frame) -> CacheKey:
         """Generate standardized cache keys
         Args:
-            frame_name: Original image resource name
+            frame: Original image resource name or Surface (hashed by identity)
+
+        Returns:
+            An immutable tuple containing (frame, scaling size, direction, rotation angle)
+        """
+        return (
+            frame, self._deps.get_scale(), 
+            self._deps.get_direction(), self._deps.get_angle()
+        )
+
+    def _load_image(self, cache_key: CacheKey, counted: bool = True) -> pygame.Surface:
+        """Produce the processed image on a cache miss, through the shared cache if enabled"""
+        shared_cache = self._deps.shared_cache
+        if shared_cache is None:
+            return self._produce_image(cache_key, counted)
+        
+        get_shared_source = self._deps.get_shared_source or self._deps.get_source_image
+        source = get_shared_source(cache_key[0])
+        display_format = self._deps.get_display_format is not None and self._deps.get_display_format()
+        shared_key = shared_cache.make_key(
+            source, *cache_key[1:], display_format
+        )
+        img = shared_cache.acquire(
+            shared_key, source, lambda: self._produce_image(cache_key, counted)
+        )
+        self._shared_keys[cache_key] = shared_key
+        return img
+
+    def _produce_image(self, cache_key: CacheKey, counted: bool = True) -> pygame.Surface:
+        """Promote the image from the cold tier, or process it, 
+        from the cached previous pipeline stage when there is one
+        (the stats of an uncounted intermediate stage are part of the image it is produced for)"""
+        with self._cache_lock:
+            cold_entry = self._cold_cache.pop(cache_key, None)
+            if cold_entry is not None:
+                self._cold_bytes -= len(cold_entry)
+                if counted:
+                    self._stats.cold_hits += 1
+        if cold_entry is not None:
+            img = _unpack_surface(zlib.decompress(cold_entry))
+            if self._deps.normalize_image is not None:
+                img = self._deps.normalize_image(img)
+            return img
+        
+        start = perf_counter()
+        derive = None
+        stage = self._previous_stage(cache_key)
+        if stage is not None:
+            base_key, remaining = stage
+            derive = lambda: self._deps.transform_image(self._fetch(base_key, counted=False), *remaining)
+        img = self._deps.process_image(*cache_key, derive)
+        if counted:
+            with self._cache_lock:
+                self._stats.record_miss_time(perf_counter() - start)
+        return img
+
+    @staticmethod
+    def _previous_stage(cache_key: CacheKey) -> Optional[Tuple[CacheKey, Tuple[Scale, Direction, float]]]:
+        """Split the transform pipeline (scaled -> flipped -> rotated) at its last stage
 
         Returns:
-            An immutable tuple containing (frame name, scaling size, direction)
+            (cache key of the previous stage, the transform remaining to apply to it),
+            or None if the cache key is the first (scaled) stage
         """
-        return frame_name, self._deps.get_scale(), self._deps.get_direction()
+        frame, scale, direction, angle = cache_key
+        if angle % 360 != 0.0:
+            return (frame, scale, direction, 0.0), ((0, 0), (False, False), angle)
+        if any(direction):
+            return (frame, scale, (False, False), 0.0), ((0, 0), direction, 0.0)
+        return None
+
+    def _demote(self, cache_key: CacheKey, img: pygame.Surface) -> None:
+        """Keep an evicted image in the compressed cold tier"""
+        try:
+            if img is self._deps.get_source_image(cache_key[0]):
+                return    # untransformed, reprocessing is free
+        except KeyError:
+            return
+        
+        blob = zlib.compress(
+            _pack_surface(img), _AnimationMagicNumber.COLD_CACHE_COMPRESS_LEVEL
+        )
+        if len(blob) > self._max_cold_bytes:
+            return
+        while self._cold_cache and self._cold_bytes + len(blob) > self._max_cold_bytes:
+            _, evicted = self._cold_cache.popitem(last=False)
+            self._cold_bytes -= len(evicted)
+        self._cold_cache[cache_key] = blob
+        self._cold_bytes += len(blob)
+
+    def _release_shared(self, cache_key: tuple) -> None:
+        """Drop this cache's reference of a shared entry (no-op for private caches)"""
+        shared_key = self._shared_keys.pop(cache_key, None)
+        if shared_key is not None and self._deps.shared_cache is not None:
+            self._deps.shared_cache.release(shared_key)
+
+    def _evict(self) -> None:
+        """Evict the cache entry chosen by the eviction policy"""
+        cache_key = self._policy.evict()
+        img = self._image_cache.pop(cache_key)
+        self._stats.evictions += 1
+        if self._max_cold_bytes:
+            self._demote(cache_key, img)
+        self._cache_bytes -= self._entry_bytes.pop(cache_key, 0)
+        self._release_shared(cache_key)
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """Return the pixel memory of the surface (width * height * bytes per pixel)"""
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
     
     def set_max_cache_size(self, size: int) -> None:
         if size < _AnimationMagicNumber.CACHE_MIN_SIZE:
@@ -217,34 +1242,70 @@ class _FrameCacheManager:
             
         with self._cache_lock:
             self._max_cache_size = size
+            self._policy.resize(size)
             while len(self._image_cache) > size:
-                self._image_cache.popitem(last=False)
+                self._evict()
+
+    def set_max_cache_bytes(self, size: int) -> None:
+        """Set the memory budget of the cache in bytes, 0 means no budget"""
+        if size < 0:
+            raise ValueError("Cache memory budget must be greater than or equal to 0")
+
+        with self._cache_lock:
+            self._max_cache_bytes = size
+            while size and self._image_cache and self._cache_bytes > size:
+                self._evict()
 
     def clear(self) -> None:
-        """Clear the cache"""
+        """Clear the cache, references of shared entries are dropped as well"""
         with self._cache_lock:
             self._image_cache.clear()
+            self._hit_buffer.clear()
+            self._policy.clear()
+            self._entry_bytes.clear()
+            self._cache_bytes = 0
+            self._cold_cache.clear()
+            self._cold_bytes = 0
+            for cache_key in list(self._shared_keys):
+                self._release_shared(cache_key)
         self._deps.logger.info("Cache cleared")
+
+    def invalidate(self, frames: Iterable[Frame]) -> int:
+        """Drop the cached images of the frames in every transform, the cold tier included
+
+        Returns:
+            Number of dropped images
+        """
+        frames = set(frames)
+        with self._cache_lock:
+            self._drain_hits()
+            stale_keys = [cache_key for cache_key in self._image_cache if cache_key[0] in frames]
+            for cache_key in stale_keys:
+                del self._image_cache[cache_key]
+                self._policy.remove(cache_key)
+                self._cache_bytes -= self._entry_bytes.pop(cache_key, 0)
+                self._release_shared(cache_key)
+            for cache_key in [cache_key for cache_key in self._cold_cache if cache_key[0] in frames]:
+                self._cold_bytes -= len(self._cold_cache.pop(cache_key))
+        return len(stale_keys)
     
-    def release(self, image: Optional[pygame.Surface]) -> None:
-        """Release the cache"""
+    def release(self) -> None:
+        """Release the cache
+
+        Only the references are dropped, the surfaces are not blanked: an untransformed frame
+        is the source image itself, which may belong to the caller, the image provider or the
+        `_image_registry`, and be displayed by other players.
+        """
         if not pygame.get_init():
             return
-        
-        surfaces = ([image] if image else []) + [
-            v for v in self._image_cache.values()
-            if isinstance(v, pygame.Surface)
-        ]
-    
-        for surf in surfaces:
-            try:
-                if surf.get_locked():
-                    surf.unlock()
-                surf.fill((0, 0, 0, 0))
-            except (pygame.error, AttributeError, RuntimeError) as error:
-                self._deps.logger.warning(f"Failed to clear surface: {surf} - {error}")
         self.clear()
-    
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss/eviction/load error counters and the miss time histogram"""
+        with self._cache_lock:
+            self._drain_hits()
+            self._stats.reset()
+
     @property
     def lock(self) -> RLock:
         """Return the cache Rlock"""
@@ -256,21 +1317,50 @@ class _FrameCacheManager:
         return self._max_cache_size
     
     @property
-    def image_cache(self) -> OrderedDict:
+    def max_cache_bytes(self) -> int:
+        """Return the cache memory budget in bytes"""
+        return self._max_cache_bytes
+
+    @property
+    def cache_bytes(self) -> int:
+        """Return the memory used by cached images in bytes"""
+        return self._cache_bytes
+    
+    @property
+    def image_cache(self) -> Dict[CacheKey, pygame.Surface]:
         """Return the cache dictionary"""
         return self._image_cache
     
     @property
-    def info(self) -> Dict[str, Union[int, List[str]]]:
+    def info(self) -> CacheInfo:
         with self.lock:
+            self._drain_hits()
             sample_keys = list(self.image_cache.keys())[
                 :_AnimationMagicNumber.SAMPLE_DISPLAY_COUNT
             ]
-            return {
+            info = {
                 "cache_size": len(self.image_cache),
                 "max_size": self.max_cache_size,
-                "sample_keys": sample_keys
+                "cache_bytes": self.cache_bytes,
+                "max_bytes": self.max_cache_bytes,
+                "policy": self._deps.cache_policy,
+                "sample_keys": sample_keys,
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "cold_hits": self._stats.cold_hits,
+                "cold_size": len(self._cold_cache),
+                "cold_bytes": self._cold_bytes,
+                "max_cold_bytes": self._max_cold_bytes,
+                "hit_ratio": self._stats.hit_ratio,
+                "evictions": self._stats.evictions,
+                "load_errors": self._stats.load_errors,
+                "miss_time": self._stats.miss_time,
+                "miss_time_histogram": self._stats.miss_time_histogram
             }
+            if self._deps.shared_cache is not None:
+                info["shared_cache_size"] = len(self._deps.shared_cache)
+                info["shared_references"] = self._deps.shared_cache.references
+            return info
 
 class _FrameStateManager:
     """Animation state manager, responsible for managing animation states, frame indices, 
@@ -400,17 +1490,277 @@ class _FrameStateManager:
                     f"Frame change callback execution failed: {str(error)}"
                 )
 
-@dataclass
+class SpriteSheet:
+    """A sprite sheet image sliced into frames, the frames are `Surface.subsurface` views
+    sharing the pixels of the sheet, so the sheet is decoded once and no pixels are copied.
+
+    ## Example:
+        sheet = SpriteSheet("hero.png")
+        frames = sheet.frames((32, 32), {"idle": (0, 4), "walk": (4, 6)})
+        player = FramePlayer(AnimationConfig(frames, {"idle": 0.1, "walk": 0.08}))
+    """
+
+    __slots__ = ("image",)
+
+    def __init__(self, image: Union[str, pygame.Surface]) -> None:
+        """
+        Args:
+            image: Sprite sheet file path or Surface
+
+        Raises:
+            ValueError: The sheet file cannot be loaded
+            TypeError: Invalid image type
+        """
+        if isinstance(image, str):
+            try:
+                image = pygame.image.load(image)
+            except (pygame.error, FileNotFoundError) as e:
+                raise ValueError(f'Cannot load sprite sheet "{image}" - {e}')
+        if not isinstance(image, pygame.Surface):
+            raise TypeError("image must be str, filepath or pygame.Surface")
+        self.image = image
+
+    def rects(self, rects: Iterable[SheetRect]) -> List[pygame.Surface]:
+        """Slice the frames at the given rects of the sheet
+
+        Raises:
+            ValueError: A rect is outside of the sheet
+        """
+        frames = []
+        for i, rect in enumerate(rects):
+            try:
+                frames.append(self.image.subsurface(rect))
+            except ValueError:
+                raise ValueError(
+                    f"rects[{i}] {tuple(pygame.Rect(rect))} is outside of the sprite sheet "
+                    f"of size {self.image.get_size()}"
+                )
+        return frames
+
+    def grid(self, 
+             frame_size: Tuple[int, int], 
+             count: Optional[int] = None, 
+             start: int = 0,
+             margin: Tuple[int, int] = (0, 0),
+             spacing: Tuple[int, int] = (0, 0)) -> List[pygame.Surface]:
+        """Slice the frames of a grid, numbered row by row from the top left cell
+
+        Args:
+            frame_size: Size of a grid cell (width, height)
+            count: Number of frames, all the cells from start if None
+            start: Number of the first cell
+            margin: Offset of the top left cell from the sheet corner (x, y)
+            spacing: Gap between two cells (x, y)
+
+        Raises:
+            ValueError: Invalid grid or the frames exceed the sheet
+        """
+        width, height = frame_size
+        if width <= 0 or height <= 0:
+            raise ValueError("frame_size must be positive")
+        sheet_width, sheet_height = self.image.get_size()
+        columns = max(0, (sheet_width - margin[0] + spacing[0]) // (width + spacing[0]))
+        rows = max(0, (sheet_height - margin[1] + spacing[1]) // (height + spacing[1]))
+        if count is None:
+            count = columns * rows - start
+        if start < 0 or count <= 0 or start + count > columns * rows:
+            raise ValueError(
+                f"Cells {start}..{start + count - 1} exceed the {columns}x{rows} grid of the sprite sheet"
+            )
+        
+        return self.rects(
+            (margin[0] + column * (width + spacing[0]), 
+             margin[1] + row * (height + spacing[1]), 
+             width, height)
+            for row, column in (divmod(cell, columns) for cell in range(start, start + count))
+        )
+
+    def frames(self, 
+               frame_size: Tuple[int, int], 
+               states: Dict[str, Tuple[int, int]],
+               margin: Tuple[int, int] = (0, 0),
+               spacing: Tuple[int, int] = (0, 0)) -> Dict[str, List[pygame.Surface]]:
+        """Slice a `FramesDict` of grid frames, see `grid`
+
+        Args:
+            frame_size: Size of a grid cell (width, height)
+            states: state name -> (number of its first cell, frames count)
+        """
+        return {
+            state: self.grid(frame_size, count, start, margin, spacing)
+            for state, (start, count) in states.items()
+        }
+
+class AnimationBundle:
+    """A packed animation file: header, state table (names, frame times, frame blocks)
+    and the pre-decoded pixel blocks of the frames.
+
+    The file is memory mapped and every frame is a `pygame.image.frombuffer` view of
+    its block, so opening a bundle decodes nothing and the pixels are paged in on first use.
+    Frames are exposed as resource names with the matching `image_provider`.
+
+    ## Example:
+        AnimationBundle.write("hero.anim", AnimationConfig(frames, frames_times))
+        player = FramePlayer.from_bundle("hero.anim", play_mode="pingpong")
+    """
+
+    __slots__ = ("path", "frames", "frames_times", "images", "_mmap")
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path: Bundle file path
+
+        Raises:
+            FileNotFoundError: File not found
+            ValueError: Not a valid bundle
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            # copy on write pages, writing to a frame never modifies the file
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.frames: Dict[str, List[str]] = {}
+        self.frames_times: FramesTimesDict = {}
+        self.images: Dict[str, pygame.Surface] = {}    # frame resource name -> frame
+        try:
+            self._read_tables()
+        except (struct.error, UnicodeDecodeError) as error:
+            raise ValueError(f'Invalid animation bundle "{path}" - {error}') from error
+
+    def _read_tables(self) -> None:
+        buffer = memoryview(self._mmap)
+        magic, version, states_count = _BUNDLE_HEADER.unpack_from(buffer)
+        if magic != _BUNDLE_MAGIC or version != _BUNDLE_VERSION:
+            raise ValueError(f'"{self.path}" is not an animation bundle of version {_BUNDLE_VERSION}')
+        
+        position = _BUNDLE_HEADER.size
+        for _ in range(states_count):
+            name_length, frame_time, frames_count = _BUNDLE_STATE.unpack_from(buffer, position)
+            position += _BUNDLE_STATE.size
+            state = bytes(buffer[position:position + name_length]).decode("utf-8")
+            position += name_length
+            
+            self.frames[state] = []
+            self.frames_times[state] = frame_time
+            for _ in range(frames_count):
+                offset, length = _BUNDLE_FRAME.unpack_from(buffer, position)
+                position += _BUNDLE_FRAME.size
+                if offset + length > len(buffer):
+                    raise ValueError(f'Truncated animation bundle "{self.path}"')
+                name = f"{self.path}#{offset}"    # frames sharing a block share the name
+                if name not in self.images:
+                    self.images[name] = _unpack_surface(buffer[offset:offset + length], copy=False)
+                self.frames[state].append(name)
+
+    def config(self, **options) -> AnimationConfig:
+        """Create an `AnimationConfig` of the bundle frames
+
+        Args:
+            options: Other `AnimationConfig` fields (play_mode, max_cache_size, ...)
+        """
+        return AnimationConfig(
+            {state: list(frame_list) for state, frame_list in self.frames.items()},
+            dict(self.frames_times),
+            **options
+        )
+
+    def injection(self, logger_instance: Optional[AbstractLogger] = None) -> AnimationParamInjection:
+        """Create an `AnimationParamInjection` providing the bundle frames"""
+        return AnimationParamInjection(dict(self.images), logger_instance)
+
+    @staticmethod
+    def write(path: str, 
+              config: AnimationConfig, 
+              image_provider: Optional[Dict[str, pygame.Surface]] = None) -> None:
+        """Write the frames and frames times of the config to a bundle file
+
+        Args:
+            path: Bundle file path, replaced atomically
+            config: Frames (image file paths or Surfaces) and frames times to pack
+            image_provider: Images of resource names which are not image files
+
+        Raises:
+            ValueError: An image file cannot be loaded
+            TypeError: Invalid frame type
+        """
+        image_provider = image_provider or {}
+        blocks: List[bytes] = []
+        block_indexes: Dict[Hashable, int] = {}    # path or id(surface) -> index of its block
+        states: List[Tuple[bytes, float, List[int]]] = []
+        for state, frame_list in config.frames.items():
+            indexes = []
+            for i, frame in enumerate(frame_list):
+                key = frame if isinstance(frame, str) else id(frame)
+                if key not in block_indexes:
+                    if isinstance(frame, pygame.Surface):
+                        surface = frame
+                    elif not isinstance(frame, str):
+                        raise TypeError(
+                            f'frames["{state}"][{i}] must be str, filepath or pygame.Surface, '
+                            f'got {type(frame).__name__}'
+                        )
+                    elif frame in image_provider:
+                        surface = image_provider[frame]
+                    else:
+                        try:
+                            surface, _ = _load_image_file(frame)
+                        except (pygame.error, FileNotFoundError) as e:
+                            raise ValueError(
+                                f'frames["{state}"][{i}]: '
+                                f'Cannot load image resource "{frame}" - {e}'
+                            )
+                    block_indexes[key] = len(blocks)
+                    blocks.append(_pack_surface(surface))
+                indexes.append(block_indexes[key])
+            states.append((state.encode("utf-8"), config.frames_times[state], indexes))
+        
+        offset = _BUNDLE_HEADER.size + sum(
+            _BUNDLE_STATE.size + len(name) + len(indexes) * _BUNDLE_FRAME.size
+            for name, _, indexes in states
+        )
+        block_offsets = []
+        for block in blocks:
+            block_offsets.append(offset)
+            offset += len(block)
+        
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(_BUNDLE_HEADER.pack(_BUNDLE_MAGIC, _BUNDLE_VERSION, len(states)))
+            for name, frame_time, indexes in states:
+                file.write(_BUNDLE_STATE.pack(len(name), frame_time, len(indexes)))
+                file.write(name)
+                for index in indexes:
+                    file.write(_BUNDLE_FRAME.pack(block_offsets[index], len(blocks[index])))
+            for block in blocks:
+                file.write(block)
+        os.replace(temp_path, path)
+
+@dataclass
 class AnimationConfig:
     frames: FramesDict
     frames_times: FramesTimesDict
     frame_scale: Scale = _AnimationMagicNumber.ORIGINAL_IMAGE_FRAME_SCALE
     max_cache_size: int = _AnimationMagicNumber.DEFAULT_MAX_CHACH_SIZE
     play_mode: PlayMode = _AnimationMagicNumber.DEFAULT_PLAY_MODE
+    shared_cache: bool = False
+    single_threaded: bool = False
+    max_cache_bytes: int = _AnimationMagicNumber.DEFAULT_MAX_CACHE_BYTES
+    angle_step: float = _AnimationMagicNumber.DEFAULT_ANGLE_STEP
+    cache_policy: CachePolicyName = _AnimationMagicNumber.DEFAULT_CACHE_POLICY
+    disk_cache_dir: Optional[str] = None
+    cold_cache_bytes: int = _AnimationMagicNumber.DEFAULT_COLD_CACHE_BYTES
+    load_workers: int = _AnimationMagicNumber.DEFAULT_LOAD_WORKERS
+    lazy_states: bool = False
+    state_idle_timeout: float = _AnimationMagicNumber.DEFAULT_STATE_IDLE_TIMEOUT
+    convert_to_display: bool = False
+    dedupe_frames: bool = False
+    hot_reload_interval: float = 0.0
+    shared_images: bool = True
+    copy_surface_frames: bool = True
 
 @dataclass
 class AnimationParamInjection:
-    image_provider: Optional[Dict[str, pygame.Surface]] = None
+    image_provider: Optional[Union[Dict[str, pygame.Surface], ImageProvider, Callable[[str], pygame.Surface]]] = None
     logger_instance: Optional[AbstractLogger] = None
 
 class FramePlayerEasilyGenerator: 
@@ -506,6 +1856,804 @@ class FramePlayerEasilyGenerator:
         
         return FramePlayer(config)
 
+class _AnimationAssets:
+    """The data shared by the players of one animation: frames, frame times, source images,
+    frame cache and lazy state bookkeeping. Validated and loaded once, then referenced by the
+    players created from it (see `FramePlayer.clone` and `AnimationClip`), the cache and the
+    image files are released with the last reference.
+    """
+
+    __slots__ = (
+        "frames", "frames_times", "frame_scale", "play_mode", "angle_step", "logger", "cache_manager",
+        "single_threaded", "convert_to_display", "display_format", "state_idle_timeout", "hot_reload_interval",
+        "loaded_states", "lazy_clock", "_image_source", "_image_provider", "_source_hashes", "_state_files",
+        "_owned_files", "_shared_images", "_file_mtimes", "_dedupe", "_content_frames", "_frame_digests",
+        "_frame_aliases", "_alias_mtimes", "_undeduped_frames", "_duplicate_surfaces", "_duplicate_surface_bytes",
+        "_frame_origins", "_surface_frames", "_load_workers", "_disk_cache", "_lock", "_load_lock", "_references", "_playing"
+    )
+
+    def __init__(self,
+                 config: AnimationConfig,
+                 injection: AnimationParamInjection) -> None:
+        """Validate the parameters and load the frames, see `FramePlayer` for the parameters
+
+        Raises:
+            ValueError: When the keys of frames and frames_time do not match
+            TypeError: When the input parameter type does not meet the requirements
+        """
+        # Advance declaration to prevent AttributeError during detection
+        self._image_source, self._image_provider = self._split_image_provider(injection.image_provider)
+        self._source_hashes: Dict[str, str] = {}    # image file path -> content hash, only recorded with a disk cache
+        self._state_files: Dict[str, Dict[str, int]] = {}    # lazy state -> its image file paths -> first index
+        self.loaded_states: Dict[str, float] = {}    # loaded lazy state -> lazy clock of its last use
+        self.lazy_clock = 0.0    # the most advanced lazy clock of the players, measures the idle time of lazy states
+        self._playing: Dict[str, int] = {}    # state -> number of players playing it, never unloaded
+        self._owned_files: set = set()    # image file paths loaded by the assets (not supplied by image_provider)
+        self._shared_images = config.shared_images    # owned files are references of the _image_registry
+        self._file_mtimes: Dict[str, int] = {}    # owned image file path -> modification time when loaded (ns)
+        self._dedupe = config.dedupe_frames
+        self._content_frames: Dict[bytes, Frame] = {}    # pixel digest -> canonical frame
+        self._frame_digests: Dict[Frame, bytes] = {}    # canonical frame -> pixel digest
+        self._frame_aliases: Dict[str, Tuple[str, int]] = {}    # duplicate file path -> (canonical path, its bytes)
+        self._alias_mtimes: Dict[str, int] = {}    # dropped duplicate file path -> modification time, still watched
+        self._undeduped_frames: Dict[str, List[Frame]] = {}    # state -> its frames before _dedupe_frames
+        self._duplicate_surfaces = 0    # duplicate Surface frames, collapsed once at construction
+        self._duplicate_surface_bytes = 0
+        self._frame_origins: Dict[pygame.Surface, pygame.Surface] = {}    # copied Surface frame -> the caller's Surface
+        self.single_threaded = config.single_threaded
+        # guards the reference count and the played states
+        self._lock = _NullLock() if config.single_threaded else RLock()
+        # serialises loading, unloading and reloading the image files (background prefetch included)
+        self._load_lock = _NullLock() if config.single_threaded else RLock()
+        self._references = 0    # players and clips using the assets
+        try:
+            self._validate_init_params(config, injection)
+
+            # Basic Parameters
+            self.frames_times = config.frames_times
+            self.frame_scale: Scale = config.frame_scale    # initial transform and play mode of the players
+            self.play_mode: PlayMode = config.play_mode
+            self.angle_step: float = config.angle_step
+            self._load_workers = config.load_workers
+            self.hot_reload_interval = config.hot_reload_interval
+            self.convert_to_display = config.convert_to_display
+            self.display_format = False    # whether the sources are converted (a display mode has been set)
+            self.state_idle_timeout = config.state_idle_timeout
+            self.logger = injection.logger_instance or DefaultLogger()
+            self._disk_cache = (
+                _DiskFrameCache(config.disk_cache_dir, self.logger)
+                if config.disk_cache_dir else None
+            )
+
+            self._process_init_frame(config)
+            if not config.lazy_states:
+                self._dedupe_frames(self.frames)
+
+            # systems init
+            self.cache_manager = \
+                _FrameCacheManager(
+                    _CacheManagerDeps(
+                        config.max_cache_size,
+                        config.max_cache_bytes,
+                        config.cache_policy,
+                        config.cold_cache_bytes,
+                        lambda: self.frame_scale,
+                        lambda: (False, False),
+                        lambda: 0.0,
+                        self._get_source_image,
+                        self._process_image,
+                        self._transform_frame,
+                        FramePlayer._create_error_surface,
+                        self.logger,
+                        _shared_frame_cache if config.shared_cache else None,
+                        config.single_threaded,
+                        self._normalize_image if config.convert_to_display else None,
+                        self._get_shared_source,
+                        lambda: self.display_format
+                    )
+                )
+            self.load_states([next(iter(self.frames.keys()))])
+            if self.convert_to_display and pygame.display.get_surface() is not None:
+                self.display_format = True
+        except BaseException:
+            self._release_owned_files()    # the registry references taken before the failure
+            raise
+
+    def acquire(self) -> None:
+        """Add a user of the assets"""
+        with self._lock:
+            self._references += 1
+
+    def release(self) -> bool:
+        """Remove a user of the assets, the last one releases the frame cache and the image files
+
+        Returns:
+            Whether the assets were released
+        """
+        with self._lock:
+            self._references -= 1
+            if self._references > 0:
+                return False
+        with self._load_lock:
+            self.cache_manager.release()
+            self._release_owned_files()
+        return True
+
+    def hold_state(self, state: Optional[str], previous: Optional[str]) -> None:
+        """Move a player from the previous state it played to the state (None: no state),
+        the lazy states played by a player are not unloaded"""
+        with self._lock:
+            if previous is not None:
+                self._playing[previous] -= 1
+                if not self._playing[previous]:
+                    del self._playing[previous]
+                    if previous in self.loaded_states:    # idle from now on
+                        self.loaded_states[previous] = self.lazy_clock
+            if state is not None:
+                self._playing[state] = self._playing.get(state, 0) + 1
+
+    @property
+    def cache_info(self) -> CacheInfo:
+        """The frame cache info, see `FramePlayer.cache_info`"""
+        info = self.cache_manager.info
+        if self._dedupe:
+            info["duplicate_frames"] = len(self._frame_aliases) + self._duplicate_surfaces
+            info["dedupe_bytes_saved"] = (
+                sum(nbytes for _, nbytes in self._frame_aliases.values()) + self._duplicate_surface_bytes
+            )
+        return info
+
+    def _process_init_frame(self, config: AnimationConfig) -> None:
+        self._surface_frames = False
+
+        _first_frame = next(iter(config.frames.values()))
+        if _first_frame != [] and isinstance(_first_frame[0], pygame.Surface):
+            self._surface_frames = True
+            if not config.copy_surface_frames:
+                # reference the caller's surfaces, only the lists are copied (rewritten by _dedupe_frames)
+                self.frames = {k: list(v) for k, v in config.frames.items()}
+                return
+            # Subsurfaces (e.g. SpriteSheet frames) are kept as views of their sheet instead of copied
+            self.frames = {
+                k: [frame if frame.get_parent() is not None else frame.copy() for frame in v]
+                for k, v in config.frames.items()
+            }
+            # the caller's surfaces identify the copies in the shared cache, so players of the same frames share
+            self._frame_origins = {
+                copy: frame
+                for k, v in config.frames.items()
+                for copy, frame in zip(self.frames[k], v) if copy is not frame
+            }
+        elif config.dedupe_frames:
+            self.frames = {k: list(v) for k, v in config.frames.items()}    # rewritten by _dedupe_frames
+        else:
+            self.frames = config.frames
+
+    @staticmethod
+    def _transform_frame(img: pygame.Surface,
+                         scale: Scale,
+                         direction: Direction,
+                         angle: float) -> pygame.Surface:
+        """Transform the frame with the scale, direction and angle
+        Args:
+            img: Original frame image
+            scale: Scaling size, (0, 0) means keeping original size
+            direction: Flipping direction (flip_x, flip_y)
+            angle: Rotation angle (in degrees)
+
+        Returns:
+            Transformed frame image
+        """
+        if scale != (0, 0) and scale != img.get_size():
+            img = pygame.transform.scale(img, scale)
+        if any(direction):
+            img = pygame.transform.flip(img, *direction)
+        if angle % 360 != 0.0:
+            img = pygame.transform.rotate(img, angle)
+        return img
+
+    def _get_source_image(self, frame: Frame) -> pygame.Surface:
+        """Get the original image of the frame
+        Args:
+            frame: Original image resource name, or the Surface itself when using Surface as a frame
+
+        Returns:
+            Original surface
+
+        Raises:
+            KeyError: Image resource not found
+        """
+        source = frame if isinstance(frame, pygame.Surface) else self._load_source(frame)
+        if not self.display_format:
+            return source
+        # converted once per source for every player, a reloaded source gets a new copy
+        return _display_surfaces.get(source)
+
+    def _get_shared_source(self, frame: Frame) -> pygame.Surface:
+        """Get the image identifying the frame in the shared cache: the caller's Surface of a copied frame,
+        the original (not display format) image otherwise, the shared key tells the display format apart
+
+        Raises:
+            KeyError: Image resource not found
+        """
+        if not isinstance(frame, pygame.Surface):
+            return self._load_source(frame)
+        return self._frame_origins.get(frame, frame)
+
+    def _load_source(self, name: str) -> pygame.Surface:
+        """Get the original image of a resource name, requesting it from the lazy image provider on first use
+
+        Raises:
+            KeyError: Image resource not found, or the image provider failed to load it
+        """
+        source = self._image_source.get(name)
+        if source is not None:
+            return source
+        if self._image_provider is None or name not in self._image_provider:
+            raise KeyError(f"Invalid image resource: {name}")
+        
+        try:
+            source = self._image_provider.get_image(name)
+        except KeyError:
+            raise
+        except Exception as error:    # e.g. a loader function raising FileNotFoundError
+            raise KeyError(f"Image provider failed to load {name}: {error}") from error
+        if not isinstance(source, pygame.Surface):
+            raise KeyError(f"Image provider returned {type(source).__name__} for {name}")
+        return self._image_source.setdefault(name, source)
+
+    @staticmethod
+    def _split_image_provider(
+        image_provider: Optional[Union[Dict[str, pygame.Surface], ImageProvider, Callable[[str], pygame.Surface]]]
+    ) -> Tuple[Dict[str, pygame.Surface], Optional[ImageProvider]]:
+        """Return (the image dict, the lazy image provider) of the injected image_provider"""
+        if isinstance(image_provider, ImageProvider):
+            return {}, image_provider
+        if callable(image_provider):
+            return {}, CallableImageProvider(image_provider)
+        return image_provider or {}, None
+
+    def _normalize_image(self, img: pygame.Surface) -> pygame.Surface:
+        """Convert an image restored from a pixel blob to the display format once it is available"""
+        return _to_display_format(img) if self.display_format else img
+
+    def _process_image(self, 
+                       frame: Frame, 
+                       scale: Scale, 
+                       direction: Direction, 
+                       angle: float,
+                       derive: Optional[Callable[[], pygame.Surface]] = None) -> pygame.Surface:
+        """Actual image processing logic
+        Args:
+            frame: Original image resource name or Surface
+            scale: Scaling size
+            direction: Flipping direction
+            angle: Rotation angle
+            derive: Produce the image from a cached intermediate stage (e.g. flip the cached scaled frame)
+                instead of transforming the original image
+
+        Returns:
+            Processed surface with scaling, flip and rotation
+
+        Raises:
+            KeyError: Image resource not found
+        """
+        source = self._get_source_image(frame)
+        disk_key = None
+        if self._disk_cache is not None and isinstance(frame, str) and frame in self._source_hashes:
+            disk_key = self._disk_cache.make_key(
+                self._source_hashes[frame], scale, direction, angle
+            )
+            img = self._disk_cache.load(disk_key)
+            if img is not None:
+                return self._normalize_image(img)
+        
+        img = derive() if derive is not None else \
+            self._transform_frame(source, scale, direction, angle)
+        if disk_key is not None and img is not source:
+            self._disk_cache.store(disk_key, img)
+        return img
+
+    def _validate_init_params(
+        self,
+        config: AnimationConfig,
+        injection: AnimationParamInjection
+    ) -> None:
+        """Verify the validity of initialization parameters
+        Args:
+            frames: Animation frames dict {state name: [frames name list]}
+            frames_time: duration each frame(in seconds) {state name: duration}
+
+        Raises:
+            ValueError: State definition is incomplete or missing
+            TypeError: Args type error
+        """
+        self._vaildate_init_config(config)
+        self._vaildate_init_injection(injection)
+
+    @staticmethod
+    def _vaildate_init_injection(injection: AnimationParamInjection) -> None:
+        if not isinstance(injection, AnimationParamInjection):
+            raise TypeError("injection must be AnimatorParamInjection")
+        image_provider = injection.image_provider
+        logger_instance = injection.logger_instance
+        if isinstance(image_provider, ImageProvider) or callable(image_provider):
+            pass    # lazy providers are only checked when an image is requested
+        elif image_provider is not None and not isinstance(image_provider, dict):
+            raise TypeError("image_provider must be a dict, an ImageProvider or a loader function")
+        elif image_provider is not None:
+            for name, img in image_provider.items():
+                if not isinstance(img, pygame.Surface):
+                    raise TypeError(
+                        f"image_provider[{name}] must be a pygame.Surface"
+                    )
+        if (logger_instance is not None and
+            not isinstance(logger_instance, AbstractLogger)):
+            raise TypeError("logger_instance must be a AbstractLogger")
+
+        
+    def _vaildate_init_config(self, config: AnimationConfig) -> None:
+        if not isinstance(config, AnimationConfig):
+            raise TypeError("config must be AnimatorConfig")
+        
+        frames = config.frames
+        frames_times = config.frames_times
+        if not isinstance(config.load_workers, int) or config.load_workers < 1:
+            raise ValueError("load_workers must be an integer greater than or equal to 1")
+        if not isinstance(config.lazy_states, bool):
+            raise TypeError("lazy_states must be a bool")
+        if not isinstance(config.shared_images, bool):
+            raise TypeError("shared_images must be a bool")
+        if not isinstance(config.copy_surface_frames, bool):
+            raise TypeError("copy_surface_frames must be a bool")
+        if not isinstance(config.state_idle_timeout, (int, float)) or config.state_idle_timeout < 0:
+            raise ValueError("state_idle_timeout must be a number greater than or equal to 0")
+        
+        pending_files: Dict[str, Tuple[str, int]] = {}    # image file path -> first (state, index) using it
+        try:
+            if len(frames) == 0:
+                raise ValueError("frames must not be empty")
+            
+            if frames.keys() != frames_times.keys():
+                missing = (set(frames.keys())
+                           .symmetric_difference(frames_times.keys())) 
+                # A.symmetric_difference(B) = (A △ B) = (A ∪ B) - (A ∩ B)
+                raise ValueError(
+                    f"States definition incomplete, missing: {missing}"
+                )
+
+            for state, frame_list in frames.items():
+                if not frame_list:
+                    raise ValueError(f'frames["{state}"] must not be empty')
+                
+                if not isinstance(frame_list, list):
+                    raise TypeError(f'frames["{state}"] must be a list')
+                
+                self._validate_frames(state, frame_list, pending_files)
+            
+            for state, frame_time in frames_times.items():
+                if not isinstance(frame_time, (float, int)):
+                    raise TypeError(f'frames_time["{state}"] must be a float')
+        except AttributeError:
+            raise TypeError("frames and frames_time must be dicts")  
+        
+        frame_scale = config.frame_scale
+        max_cache_size = config.max_cache_size
+        play_mode = config.play_mode
+        if not (isinstance(frame_scale, tuple) or 
+                all(isinstance(i, (int, float)) for i in frame_scale)):
+            raise TypeError("frame_scale must be a tuple of two numbers")
+        if (not isinstance(max_cache_size, int) or
+            max_cache_size < _AnimationMagicNumber.CACHE_MIN_SIZE):
+            raise ValueError(
+                "max_cache_size must be an integer greater than or equal to "
+                f"{_AnimationMagicNumber.CACHE_MIN_SIZE}"
+            )
+        if not isinstance(config.max_cache_bytes, int) or config.max_cache_bytes < 0:
+            raise ValueError("max_cache_bytes must be an integer greater than or equal to 0")
+        if not isinstance(config.angle_step, (int, float)) or config.angle_step < 0:
+            raise ValueError("angle_step must be a number greater than or equal to 0")
+        if not isinstance(config.cold_cache_bytes, int) or config.cold_cache_bytes < 0:
+            raise ValueError("cold_cache_bytes must be an integer greater than or equal to 0")
+        if config.disk_cache_dir is not None and not isinstance(config.disk_cache_dir, str):
+            raise TypeError("disk_cache_dir must be a str")
+        if config.cache_policy not in get_args(CachePolicyName):
+            raise ValueError(
+                f"Invalid cache policy: {config.cache_policy}, "
+                f"cache policy must be one of {get_args(CachePolicyName)}"
+            )
+        if play_mode not in get_args(PlayMode):
+            raise ValueError(
+                f"Invalid play mode: {play_mode},"
+                "play mode must be one of {get_args(PlayMode)}"
+            )
+        if not isinstance(config.shared_cache, bool):
+            raise TypeError("shared_cache must be a bool")
+        if not isinstance(config.single_threaded, bool):
+            raise TypeError("single_threaded must be a bool")
+        if not isinstance(config.convert_to_display, bool):
+            raise TypeError("convert_to_display must be a bool")
+        if not isinstance(config.dedupe_frames, bool):
+            raise TypeError("dedupe_frames must be a bool")
+        if not isinstance(config.hot_reload_interval, (int, float)) or config.hot_reload_interval < 0:
+            raise ValueError("hot_reload_interval must be a number greater than or equal to 0")
+        
+        # files are loaded last, so that no registry reference is taken for an invalid config
+        if config.lazy_states:
+            self._defer_frame_files(config.frames, pending_files)
+        else:
+            self._load_frame_files(
+                pending_files, config.load_workers, config.disk_cache_dir is not None
+            )
+
+    def _validate_frames(self, 
+                         state: str, 
+                         frame_list: list, 
+                         pending_files: Dict[str, Tuple[str, int]]) -> None:
+        """validate frame images and collect the image files to load
+        Args:
+            state: animation state name
+            frame_list: frame image list (str or pygame.Surface)
+            pending_files: image file path -> first (state, index) using it, updated in place
+        Raises:
+            TypeError: Invalid frame type"""
+        for i, frame in enumerate(frame_list):
+            if not isinstance(frame, (str, pygame.Surface)):
+                raise TypeError(
+                    f'frames["{state}"][{i}] must be str, filepath or pygame.Surface, '
+                    f'got {type(frame).__name__}'
+                )
+            
+            if (isinstance(frame, str) and frame not in self._image_source and
+                not (self._image_provider is not None and frame in self._image_provider)):
+                pending_files.setdefault(frame, (state, i))
+
+    def _load_frame_files(self, 
+                          pending_files: Dict[str, Tuple[str, int]], 
+                          workers: int, 
+                          hash_sources: bool = False) -> None:
+        """Load the image files, decoding them on a thread pool when workers > 1 and
+        at least two files are not already decoded in the `_image_registry`
+
+        pygame releases the GIL while decoding, so files are decoded in parallel.
+        Errors are reported in frames order regardless of which decode finishes first.
+
+        Args:
+            pending_files: image file path -> first (state, index) using it
+            workers: maximum number of loading threads
+            hash_sources: record the content hash of loaded files (for the disk cache)
+        Raises:
+            ValueError: An image file cannot be loaded, the first one in frames order is reported"""
+        def load(path: str) -> Tuple[Optional[Tuple[pygame.Surface, Optional[str], int]], Optional[Exception]]:
+            try:
+                if self._shared_images:
+                    return _image_registry.acquire(path, hash_sources), None
+                mtime = os.stat(path).st_mtime_ns    # before reading, a write during the load is seen as a change
+                return (*_load_image_file(path, hash_sources), mtime), None
+            except (pygame.error, OSError) as e:    # OSError: e.g. a directory, no permission
+                return None, e
+        
+        paths = list(pending_files)
+        hits: Dict[str, Tuple[pygame.Surface, Optional[str], int]] = {}
+        if self._shared_images:
+            # files already in the registry take no decoding, only the misses are sent to the pool
+            for path in paths:
+                try:
+                    entry = _image_registry.acquire_loaded(path, hash_sources)
+                except OSError:
+                    continue    # reported by load()
+                if entry is not None:
+                    hits[path] = entry
+        misses = [path for path in paths if path not in hits]
+        
+        workers = min(workers, len(misses))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = dict(zip(misses, executor.map(load, misses)))
+        else:
+            results = None    # loaded one by one, stops loading at the first error
+
+        loaded_paths = []
+        for index, path in enumerate(paths):
+            if path in hits:
+                loaded, error = hits[path], None
+            else:
+                loaded, error = results[path] if results is not None else load(path)
+            if error is not None:
+                # roll back this call, the registry references of the hits and of the files loaded by the pool included
+                for loaded_path in loaded_paths:
+                    self._release_file(loaded_path)
+                if self._shared_images:
+                    for other_path in paths[index + 1:]:
+                        if other_path in hits or (results is not None and results[other_path][0] is not None):
+                            _image_registry.release(other_path)
+                state, i = pending_files[path]
+                raise ValueError(
+                    f'frames["{state}"][{i}]: '
+                    f'Cannot load image resource "{path}" - {error}'
+                )
+            loaded_surface, source_hash, mtime = loaded
+            self._image_source[path] = loaded_surface
+            self._owned_files.add(path)
+            self._file_mtimes[path] = mtime
+            if source_hash is not None:
+                self._source_hashes[path] = source_hash
+            loaded_paths.append(path)
+
+    def _release_owned_files(self) -> None:
+        """Drop the registry references of every image file loaded by the assets"""
+        if self._shared_images:
+            for path in self._owned_files:
+                _image_registry.release(path)
+        self._owned_files.clear()
+
+    def _release_file(self, path: str) -> None:
+        """Forget an image file loaded by the assets, dropping its registry reference"""
+        if path not in self._owned_files:
+            return
+        self._owned_files.discard(path)
+        self._file_mtimes.pop(path, None)
+        self._image_source.pop(path, None)
+        if self._shared_images:
+            _image_registry.release(path)
+
+    def _defer_frame_files(self, 
+                           frames: FramesDict, 
+                           pending_files: Dict[str, Tuple[str, int]]) -> None:
+        """Check the image files exist and record them per state, to be loaded by `_load_states`
+        Raises:
+            ValueError: An image file does not exist, the first one in frames order is reported"""
+        for path, (state, i) in pending_files.items():
+            if not os.path.isfile(path):
+                raise ValueError(
+                    f'frames["{state}"][{i}]: '
+                    f'Cannot load image resource "{path}" - No such file'
+                )
+        for state, frame_list in frames.items():
+            self._state_files[state] = {}
+            for i, frame in enumerate(frame_list):
+                if isinstance(frame, str) and frame in pending_files:
+                    self._state_files[state].setdefault(frame, i)
+
+    def load_states(self, states: Iterable[str]) -> None:
+        """Load the image files of the lazy states which are not loaded yet (no-op without lazy_states)
+        Raises:
+            ValueError: An image file cannot be loaded"""
+        if not self._state_files:
+            return
+        
+        # a state prefetched in the background and played meanwhile waits for that load instead of loading twice
+        with self._load_lock:
+            pending_files: Dict[str, Tuple[str, int]] = {}
+            loading_states = []
+            for state in states:
+                if state not in self._state_files:
+                    continue
+                self.loaded_states[state] = self.lazy_clock
+                if state in loading_states:
+                    continue
+                loading_states.append(state)
+                for path, i in self._state_files[state].items():
+                    if path not in self._image_source:
+                        pending_files.setdefault(path, (state, i))
+            if pending_files:
+                try:
+                    self._load_frame_files(pending_files, self._load_workers, self._disk_cache is not None)
+                except ValueError:
+                    for state in loading_states:
+                        self.loaded_states.pop(state, None)
+                    raise
+                self.logger.info(f"Loaded states: {loading_states}")
+            self._dedupe_frames(loading_states)
+
+    def unload_state(self, state: str) -> None:
+        """Unload the image files only used by this lazy state, and drop their cached images"""
+        self.loaded_states.pop(state, None)
+        in_use = {
+            path
+            for other_state in self.loaded_states
+            for path in self._state_files[other_state]
+        }
+        paths = [path for path in self._state_files[state] if path not in in_use]
+        for path in paths:
+            self._release_file(path)
+            self._forget_digest(path)
+        self.cache_manager.invalidate(paths)
+        self.logger.info(f"Unloaded state: {state}")
+
+    def _dedupe_frames(self, states: Iterable[str]) -> None:
+        """Collapse the frames of the states with identical pixels to one canonical frame,
+        so the cache transforms and stores each unique image once (no-op without dedupe_frames)
+
+        Frame lists are rewritten to the canonical frames, duplicate files loaded by the assets
+        are dropped, and lazy states load the canonical file instead of the duplicate.
+        """
+        if not self._dedupe:
+            return
+        
+        for state in states:
+            self._undeduped_frames.setdefault(state, list(self.frames[state]))
+            deduped: List[Frame] = []
+            for frame in self.frames[state]:
+                canonical = self._canonical_frame(frame)
+                if canonical is not frame and isinstance(frame, str):
+                    state_files = self._state_files.get(state)
+                    if state_files is not None and frame in state_files:
+                        state_files.setdefault(canonical, state_files.pop(frame))
+                    if frame in self._file_mtimes:    # keep watching the dropped file for hot reload
+                        self._alias_mtimes[frame] = self._file_mtimes[frame]
+                    self._release_file(frame)
+                deduped.append(canonical)
+            self.frames[state] = deduped
+
+    def _canonical_frame(self, frame: Frame) -> Frame:
+        """Return the first seen frame with the same pixels as the frame"""
+        if isinstance(frame, str) and frame in self._frame_aliases:
+            return self._frame_aliases[frame][0]
+        if frame in self._frame_digests:
+            return frame
+        
+        source = frame if isinstance(frame, pygame.Surface) else self._load_source(frame)
+        digest = _pixel_digest(source)
+        canonical = self._content_frames.setdefault(digest, frame)
+        if canonical is frame:
+            self._frame_digests[frame] = digest
+        elif isinstance(frame, str):
+            self._frame_aliases[frame] = (canonical, _FrameCacheManager.surface_bytes(source))
+        else:
+            self._duplicate_surfaces += 1
+            self._duplicate_surface_bytes += _FrameCacheManager.surface_bytes(source)
+        return canonical
+
+    def _forget_digest(self, path: str) -> None:
+        """Forget the pixel digest of an unloaded file, and the duplicates collapsed to it"""
+        self._frame_aliases.pop(path, None)
+        self._alias_mtimes.pop(path, None)
+        digest = self._frame_digests.pop(path, None)
+        if digest is None:
+            return
+        self._content_frames.pop(digest, None)
+        for duplicate, (canonical, _) in list(self._frame_aliases.items()):
+            if canonical == path:
+                del self._frame_aliases[duplicate]
+                self._alias_mtimes.pop(duplicate, None)
+
+    def _split_aliases(self, paths: Iterable[str]) -> List[str]:
+        """Give duplicate files collapsed by dedupe_frames their own frames back (their canonical file
+        or themselves changed), loading them in the loaded states and deduping these states again
+
+        Returns:
+            The split file paths
+
+        Raises:
+            ValueError: A duplicate file cannot be loaded, nothing is split in this case
+        """
+        paths = {path for path in paths if path in self._frame_aliases}
+        states = [
+            state for state, originals in self._undeduped_frames.items()
+            if not paths.isdisjoint(originals)
+        ]
+        # lazy states not loaded are only rewritten, _load_states loads and dedupes them when played
+        loaded_states = [
+            state for state in states 
+            if state not in self._state_files or state in self.loaded_states
+        ]
+        pending_files: Dict[str, Tuple[str, int]] = {}
+        for state in loaded_states:
+            for i, original in enumerate(self._undeduped_frames[state]):
+                if original in paths and original not in self._image_source:
+                    pending_files.setdefault(original, (state, i))
+        if pending_files:
+            self._load_frame_files(pending_files, self._load_workers, self._disk_cache is not None)
+        
+        for path in paths:
+            del self._frame_aliases[path]
+            self._alias_mtimes.pop(path, None)
+        for state in states:
+            originals = self._undeduped_frames[state]
+            self.frames[state] = [
+                original if original in paths else frame
+                for original, frame in zip(originals, self.frames[state])
+            ]
+            state_files = self._state_files.get(state)
+            if state_files is not None:
+                for i, original in enumerate(originals):
+                    if original in paths:
+                        state_files.setdefault(original, i)
+        self._dedupe_frames(loaded_states)
+        return list(paths)
+
+    def unload_idle_states(self, lazy_clock: float) -> None:
+        """Unload the lazy states no player played for longer than state_idle_timeout
+
+        Args:
+            lazy_clock: The lazy clock of the calling player, the clock of the assets follows the most advanced player
+        """
+        if lazy_clock > self.lazy_clock:
+            self.lazy_clock = lazy_clock
+        if not self._load_lock.acquire(blocking=False):
+            return    # files being loaded, the idle states are unloaded on a later update
+        try:
+            with self._lock:
+                deadline = self.lazy_clock - self.state_idle_timeout
+                for state, last_used in list(self.loaded_states.items()):
+                    if state in self._playing:
+                        self.loaded_states[state] = self.lazy_clock
+                    elif last_used < deadline:
+                        self.unload_state(state)
+        finally:
+            self._load_lock.release()
+
+    def unload_states(self, states: Iterable[str]) -> None:
+        """Unload the image files of lazy states, the states played by a player are kept loaded"""
+        with self._load_lock, self._lock:
+            for state in states:
+                if state in self.loaded_states and state not in self._playing:
+                    self.unload_state(state)
+
+    def reload_changed_files(self) -> List[str]:
+        """Reload the image files modified since they were loaded, see `FramePlayer.reload_changed_files`
+
+        Returns:
+            The reloaded file paths
+        """
+        with self._load_lock:
+            return self._reload_changed_files()
+
+    def _reload_changed_files(self) -> List[str]:
+        """Reload the changed image files, the load lock must be held"""
+        changed = []
+        changed_aliases = []
+        for watched, changed_paths in ((self._file_mtimes, changed), (self._alias_mtimes, changed_aliases)):
+            for path, mtime in list(watched.items()):
+                try:
+                    if os.stat(path).st_mtime_ns != mtime:
+                        changed_paths.append(path)
+                except OSError:
+                    continue
+        if not changed and not changed_aliases:
+            return []
+        
+        reloaded = []
+        for path in changed:
+            try:
+                if self._shared_images:
+                    surface, source_hash, mtime = _image_registry.reload(
+                        path, self._file_mtimes[path], path in self._source_hashes
+                    )
+                else:
+                    mtime = os.stat(path).st_mtime_ns
+                    surface, source_hash = _load_image_file(path, path in self._source_hashes)
+            except (pygame.error, OSError) as error:
+                self.logger.warning(f"Hot reload of {path} failed, retrying later - {error}")
+                continue
+            self._image_source[path] = surface
+            self._file_mtimes[path] = mtime
+            if source_hash is not None:
+                self._source_hashes[path] = source_hash
+            digest = self._frame_digests.pop(path, None)
+            if digest is not None:
+                self._content_frames.pop(digest, None)
+                digest = self._frame_digests[path] = _pixel_digest(surface)
+                self._content_frames.setdefault(digest, path)
+            reloaded.append(path)
+        
+        # duplicates of a changed file, or changed themselves, are no longer known to be identical
+        split = changed_aliases + [
+            duplicate for duplicate, (canonical, _) in self._frame_aliases.items() if canonical in reloaded
+        ]
+        if split:
+            try:
+                reloaded += self._split_aliases(split)
+            except ValueError as error:
+                self.logger.warning(f"Hot reload of duplicate frames failed, retrying later - {error}")
+        if not reloaded:
+            return []
+        
+        self.cache_manager.invalidate(reloaded)
+        self.logger.info(f"Hot reloaded: {reloaded}")
+        return reloaded
+
 class FramePlayer(AbstractAnimationPlayer):
     """A frame animation player that supports cache optimization and animation event callbacks, 
     inherited from pygame.sprite.Sprite.
@@ -547,11 +2695,11 @@ class FramePlayer(AbstractAnimationPlayer):
     """
     
     __slots__ = (
-        "_image_source", "frames", "frames_times", "frame_scale", "angle"
+        "_assets", "frames", "frames_times", "frame_scale", "angle"
         "play_mode", "direction", "_cache_manager", "_state_manager",
         "_play_count", "_on_complete_callbacks", "_on_frame_change_callbacks",
-        "_on_state_change_callbacks", "_last_transform", "_last_direction", "_last_angle"
-        "image", "rect", "_released", "_pingpong_direction", "_surface_frames", "_logger"
+        "_on_state_change_callbacks", "_last_transform", "_last_direction", "_last_angle",
+        "angle_step", "image", "rect", "_released", "_pingpong_direction", "_logger"
     )
     
     def __init__(
@@ -569,25 +2717,84 @@ class FramePlayer(AbstractAnimationPlayer):
                     2. {"state1": [surface1, surface2, ...], ...} -
                         Directly use pygame.Surface object
 
-                frames_time: The frame interval time (in seconds) for each animation state, in the format of:
-                    {
-                        "state1": duration each frames(in seconds),
-                        "state2": duration each frames(in seconds),
-                        ...
-                    }
-                    Must be completely consistent with the keys of frames
+                frames_time: The frame interval time (in seconds) for each animation state, in the format of:
+                    {
+                        "state1": duration each frames(in seconds),
+                        "state2": duration each frames(in seconds),
+                        ...
+                    }
+                    Must be completely consistent with the keys of frames
+
+                frame_scale: Scale size applied to all frames (width, height), give `(0, 0)` means keeping original size (default)
+
+                max_cache_size: The maximum number of cached images, when reached, will eliminate the oldest unused frames
+
+                play_mode: Initial playback mode, optional:
+                    - "loop": Loop playback (default)
+                    - "once": Play only once
+                    - "pingpong": Round trip playback
+
+                shared_cache: Share transformed frames with every other player created with `shared_cache=True`,
+                    keyed on (source image, scale, direction, angle). `release()` only drops this player's references.
+                    Sources are identified by object, not by pixels: file frames share the image of the `shared_images`
+                    registry, Surface frames share the caller's Surface (not the player's copy), so players only share
+                    when they are given the same Surface objects, and a Surface modified after creating players is not
+                    seen by the frames they already share
+
+                single_threaded: Declare the player is only used by one thread, every lock of the player and its
+                    frame cache is replaced by a no-op lock to save the locking cost per update.
+                    `background=True` of `prewarm`, `prewarm_many` and `prefetch_states` is refused. Default False
+
+                max_cache_bytes: Memory budget of the cached images in bytes (width * height * bytes per pixel),
+                    the least recently used frames are eliminated when exceeded. `0` means no budget (default)
+
+                angle_step: Rotation angles are rounded to a multiple of this step (in degrees) before rotating and caching,
+                    so a spinning sprite only produces a bounded set of rotated frames. `0` means no quantization (default)
+
+                cache_policy: Eviction policy of the frame cache, optional:
+                    - "lru": Least recently used (default)
+                    - "lfu": Least frequently used
+                    - "arc": Adaptive replacement cache, keeps hot looping states through one-shot states
+                    - "clock": Second chance approximation of LRU with cheaper hits
+
+                disk_cache_dir: Directory of a persistent cache of transformed frames loaded from image files,
+                    keyed by the file content hash and the transform, so later runs skip the transforms. None disables it (default)
+
+                cold_cache_bytes: Memory budget in bytes of a second cache tier keeping evicted frames as zlib compressed pixels,
+                    which are decompressed instead of processed again on the next miss. `0` disables it (default)
+
+                load_workers: Number of threads decoding the image files of `frames` during construction,
+                    `1` loads them sequentially. Default 4
+
+                lazy_states: Only check the image files exist during construction, and load the files of a state on its
+                    first `set_state` (or `prefetch_states`/`prewarm`). Default False
+
+                state_idle_timeout: With lazy_states, unload the files of states not played for this long
+                    (sum of the `update_frame` dt, in seconds). States played by a clone or another player
+                    of the same `AnimationClip` are kept loaded. `0` never unloads (default)
+
+                convert_to_display: Convert the source images to the display pixel format once a display mode is set
+                    (`convert()` for opaque frames, `convert_alpha()` otherwise), so blits skip the per-pixel conversion.
+                    Each source is converted once and the copy is shared by every player using it. Default False
+
+                dedupe_frames: Hash the pixels of the frames when they are loaded and collapse identical frames
+                    (e.g. hold frames, idle poses shared by states) to one source image, so each unique image
+                    is transformed and cached once. Default False
 
-                frame_scale: Scale size applied to all frames (width, height), give `(0, 0)` means keeping original size (default)
+                hot_reload_interval: Poll the modification time of the loaded image files every this many seconds
+                    in `update_frame`, reloading the changed files and dropping only the images cached from them.
+                    `0` disables it (default), `reload_changed_files()` polls manually
 
-                max_cache_size: The maximum number of cached images, when reached, will eliminate the oldest unused frames
+                shared_images: Get the image files from a process-wide registry shared by every player, so each file is
+                    decoded once and its pixels are shared, it is evicted when no player references it. Default True
 
-                play_mode: Initial playback mode, optional:
-                    - "loop": Loop playback (default)
-                    - "once": Play only once
-                    - "pingpong": Round trip playback
+                copy_surface_frames: Copy the Surface frames at construction so later changes of the caller's surfaces
+                    do not affect the player. The player never draws on its frames, so `False` references the caller's
+                    surfaces directly, skipping the copies (the caller must not modify them afterwards). Default True
             injection: `AnimatorParamInjection` object, containing the following parameters:
                 image_provider: Provide a mapping dictionary from frame name to image surface. If None, the global resource_manager.
-                get_image method is used by default to obtain the image
+                get_image method is used by default to obtain the image. An `ImageProvider` (e.g. `ZipImageProvider`) or a
+                loader function `(name) -> pygame.Surface` provides the images lazily, only when the frame cache misses them
 
                 logger_instance: Provide a logger instance for logging, if None, the global logger is used.
 
@@ -603,116 +2810,160 @@ class FramePlayer(AbstractAnimationPlayer):
             Suggest using frame images of the same size for optimal performance
         """
         super().__init__()
-        self._image_source = injection.image_provider or {} # Advance declaration to prevent AttributeError during detection
-        self._validate_init_params(config, injection)
-
-        # Basic Parameters
-        self.frames_times = config.frames_times
-        self.frame_scale: Scale = config.frame_scale
-        self.play_mode: PlayMode = config.play_mode
+        self._released = True    # until constructed, so __del__ of a failed construction does nothing
+        self._bind_assets(_AnimationAssets(config, injection))
+        self.frame_scale: Scale = self._assets.frame_scale
+        self.play_mode: PlayMode = self._assets.play_mode
         self.direction: Direction = (False, False)
         self.angle: float = 0.0
-        self._logger = injection.logger_instance or DefaultLogger()
-
-        self._process_init_frame(config)
-
-        # systems init
-        self._cache_manager = \
-            _FrameCacheManager(
-                _CacheManagerDeps(
-                    config.max_cache_size,
-                    lambda: self.frame_scale,
-                    lambda: self.direction,
-                    self._process_image,
-                    self._create_error_surface,
-                    lambda: self._surface_frames,
+        self._init_playback()
+
+    def _bind_assets(self, assets: _AnimationAssets) -> None:
+        """Reference the shared assets, the references read on every update are kept on the player"""
+        self._assets = assets
+        self.frames = assets.frames
+        self.frames_times = assets.frames_times
+        self.angle_step: float = assets.angle_step
+        self._cache_manager = assets.cache_manager
+        self._logger = assets.logger
+        self._next_reload_check = perf_counter() + assets.hot_reload_interval
+        self._lazy_clock = assets.lazy_clock    # sum of the update_frame dt, advances the clock of the assets
+        self._held_state: Optional[str] = None    # the state this player is counted as playing by the assets
+        # guards the playback state, the frame cache has its own finer grained locking
+        self._state_lock = _NullLock() if assets.single_threaded else RLock()
+        assets.acquire()
+
+    def _init_playback(self) -> None:
+        """Initialize the per-entity playback state and the first image,
+        the reference to the assets is dropped if it fails"""
+        try:
+            self._state_manager = \
+                _FrameStateManager(
+                    self.frames,
                     self._logger
                 )
+            self._state_manager.set_state(next(iter(self.frames.keys())))
+            self._hold_state()
+
+            # track status
+            self._last_scale: Scale = (0, 0)
+            self._last_direction: Direction = (False, False)
+            self._last_angle: float = 0.0
+            self.image: Optional[pygame.Surface] = None
+            self.rect: Optional[pygame.Rect] = None
+
+            self._pingpong_direction: int = 1
+            self._animation_system: Optional[AnimationSystem] = None    # the system advancing this player, if any
+
+            # Initialize image
+            self.image = self._cache_manager.get_image(
+                self.frames[self._state_manager.current_state][0],
+                self.frame_scale, self.direction, self.angle
             )
-        self._state_manager = \
-            _FrameStateManager(
-                self.frames,
-                self._logger
-            )
-        self._state_manager.set_state(next(iter(self.frames.keys())))
-
-        # track status
-        self._last_scale: Scale = (0, 0)
-        self._last_direction: Direction = (False, False)
-        self._last_angle: float = 0.0
-        self.image: Optional[pygame.Surface] = None
-        self.rect: Optional[pygame.Rect] = None
+            self.rect = self.image.get_rect()
+        except BaseException:
+            self._assets.release()    # the last reference releases the files loaded for the player
+            raise
         self._released = False
 
-        self._pingpong_direction: int = 1
-
-        # Initialize image
-        if self._surface_frames:
-            self.image = self._process_surface_frame(
-                self.frames[self._state_manager.current_state][0]
-                )
-        else:
-            self.image = self._cache_manager.get_cached_image(
-                str(self.frames[self._state_manager.current_state][0])
-            )
-        self.rect = self.image.get_rect()
-
-    def _process_init_frame(self, config: AnimationConfig) -> None:
-        self._surface_frames = False
-
-        _first_frame = next(iter(config.frames.values()))
-        if _first_frame != [] and isinstance(_first_frame[0], pygame.Surface):
-            self._surface_frames = True
-            self.frames = {
-                k: [frame.copy() for frame in v]
-                for k, v in config.frames.items()
-            }
-        else:
-            self.frames = config.frames
+    @classmethod
+    def from_clip(cls, clip: AnimationClip) -> FramePlayer:
+        """Create a lightweight player of a shared `AnimationClip`, skipping validation and loading
 
-    def _transform_frame(self, img: pygame.Surface) -> pygame.Surface:
-        """Transform the frame with self.frame_scale and self.direction
-        Args:
-            img: Original frame image
+        The player only holds its playback state (state, frame index, transform, image),
+        the frames, source images and frame cache are the ones of the clip.
 
-        Returns:
-            Transformed frame image
+        Raises:
+            RuntimeError: The clip has been released
         """
-        if self.frame_scale != (0, 0) and self.frame_scale != img.get_size():
-            img = pygame.transform.scale(img, self.frame_scale)
-        if any(self.direction):
-            img = pygame.transform.flip(img, *self.direction)
-        if self.angle % 360 != 0.0:
-            img = pygame.transform.rotate(img, self.angle)
-        return img
-
-    def _process_surface_frame(self, surface: pygame.Surface) -> pygame.Surface:
-        """Process self.frame_scale with self.direction to the Surface
+        if clip._released:
+            raise RuntimeError("Cannot create a player of a released clip")
+        player = cls._sharing_player(clip._assets)
+        player.frame_scale = clip._assets.frame_scale
+        player.play_mode = clip._assets.play_mode
+        player.direction = (False, False)
+        player.angle = 0.0
+        player._init_playback()
+        return player
 
-        Args:
-            surface: Original pygame.Surface
+    @classmethod
+    def _sharing_player(cls, assets: _AnimationAssets) -> FramePlayer:
+        """Create a player without playback state referencing the shared assets"""
+        player = cls.__new__(cls)
+        super(FramePlayer, player).__init__()
+        player._released = True
+        player._bind_assets(assets)
+        return player
+
+    def clone(self) -> FramePlayer:
+        """Create an independent player sharing the frames, source images and frame cache of this player,
+        skipping validation, frame copies and loading
+
+        The clone starts with a copy of the playback state (state, frame index, timer, transform,
+        play mode) and of the callback lists. The shared assets are released with their last player
+        (or `AnimationClip`), so the clones and this player can be released in any order.
 
-        Returns:
-            Processed surface with scaling and flip
+        Raises:
+            RuntimeError: The player has been released
         """
+        if self._released:
+            raise RuntimeError("Cannot clone a released player")
+
+        with self._state_lock:
+            player = self._sharing_player(self._assets)
+            player.frame_scale = self.frame_scale
+            player.play_mode = self.play_mode
+            player.direction = self.direction
+            player.angle = self.angle
+
+            state_manager = self._state_manager
+            player._state_manager = _FrameStateManager(player.frames, player._logger)
+            player._state_manager.current_state = state_manager.current_state
+            player._state_manager.frame_index = state_manager.frame_index
+            player._state_manager.time_since_last_frame = state_manager.time_since_last_frame
+            player._state_manager._on_complete_callbacks = list(state_manager._on_complete_callbacks)
+            player._state_manager._on_frame_change_callbacks = list(state_manager._on_frame_change_callbacks)
+            player._state_manager._on_state_change_callbacks = list(state_manager._on_state_change_callbacks)
+            player._hold_state()
+
+            player._last_scale = self._last_scale
+            player._last_direction = self._last_direction
+            player._last_angle = self._last_angle
+            player._pingpong_direction = self._pingpong_direction
+            player._animation_system = None
+            player._released = False
+            # the cached image is shared read-only, the rect is moved per entity
+            player.image = self.image
+            player.rect = self.rect.copy() if self.rect is not None else None
+        return player
 
-        return self._transform_frame(surface.copy())
-    
-    def _process_image(self, frame_name: str) -> pygame.Surface:
-        """Actual image processing logic
-        Args:
-            frame_name: Original image resource name
+    @classmethod
+    def from_bundle(cls, 
+                    path: str, 
+                    logger_instance: Optional[AbstractLogger] = None, 
+                    **options) -> FramePlayer:
+        """Create a player playing an animation bundle file, see `AnimationBundle`
 
-        Returns:
-            Processed surface with scaling and flip
+        Args:
+            path: Bundle file path
+            logger_instance: Logger of the player
+            options: Other `AnimationConfig` fields (play_mode, max_cache_size, ...)
 
         Raises:
-            KeyError: Image resource not found
+            FileNotFoundError: File not found
+            ValueError: Not a valid bundle
         """
-        if frame_name not in self._image_source:
-            raise KeyError(f"Invalid image resource: {frame_name}")
-        
-        return self._transform_frame(self._image_source[frame_name])
+        bundle = AnimationBundle(path)
+        return cls(bundle.config(**options), bundle.injection(logger_instance))
+
+    def _check_display_format(self) -> None:
+        """Switch to display format sources once a display mode is set, the images cached before are dropped"""
+        if pygame.display.get_surface() is None:
+            return
+        if not self._assets.display_format:
+            self._assets.display_format = True
+            self._cache_manager.clear()
+        self._update_image()
 
     def _get_frame(self, state: str, frame_index: int) -> pygame.Surface:
         """Get given state's and frame index's frame
@@ -734,126 +2985,11 @@ class FramePlayer(AbstractAnimationPlayer):
         if frame_index < 0 or frame_index >= len(self.frames[state]):
             raise IndexError(f"Index out of range: {frame_index}")
         
-        if self._surface_frames:
-            surface: pygame.Surface = self.frames[state][frame_index]
-            return self._process_surface_frame(surface)
-        else:
-            frame_name: str = self.frames[state][frame_index]
-            return self._cache_manager.get_cached_image(frame_name)
+        return self._cache_manager.get_image(
+            self.frames[state][frame_index], self.frame_scale, self.direction, self.angle
+        )
 
     
-    def _validate_init_params(
-        self,
-        config: AnimationConfig,
-        injection: AnimationParamInjection
-    ) -> None:
-        """Verify the validity of initialization parameters
-        Args:
-            frames: Animation frames dict {state name: [frames name list]}
-            frames_time: duration each frame(in seconds) {state name: duration}
-
-        Raises:
-            ValueError: State definition is incomplete or missing
-            TypeError: Args type error
-        """
-        self._vaildate_init_config(config)
-        self._vaildate_init_injection(injection)
-
-    @staticmethod
-    def _vaildate_init_injection(injection: AnimationParamInjection) -> None:
-        if not isinstance(injection, AnimationParamInjection):
-            raise TypeError("injection must be AnimatorParamInjection")
-        image_provider = injection.image_provider
-        logger_instance = injection.logger_instance
-        if image_provider is not None and not isinstance(image_provider, dict):
-            raise TypeError("image_provider must be a dict")
-        elif image_provider is not None:
-            for name, img in image_provider.items():
-                if not isinstance(img, pygame.Surface):
-                    raise TypeError(
-                        f"image_provider[{name}] must be a pygame.Surface"
-                    )
-        if (logger_instance is not None and
-            not isinstance(logger_instance, AbstractLogger)):
-            raise TypeError("logger_instance must be a AbstractLogger")
-
-        
-    def _vaildate_init_config(self, config: AnimationConfig) -> None:
-        if not isinstance(config, AnimationConfig):
-            raise TypeError("config must be AnimatorConfig")
-        
-        frames = config.frames
-        frames_times = config.frames_times
-        try:
-            if len(frames) == 0:
-                raise ValueError("frames must not be empty")
-            
-            if frames.keys() != frames_times.keys():
-                missing = (set(frames.keys())
-                           .symmetric_difference(frames_times.keys())) 
-                # A.symmetric_difference(B) = (A △ B) = (A ∪ B) - (A ∩ B)
-                raise ValueError(
-                    f"States definition incomplete, missing: {missing}"
-                )
-
-            for state, frame_list in frames.items():
-                if not frame_list:
-                    raise ValueError(f'frames["{state}"] must not be empty')
-                
-                if not isinstance(frame_list, list):
-                    raise TypeError(f'frames["{state}"] must be a list')
-                
-                self._validate_and_load_frames(state, frame_list)
-            
-            for state, frame_time in frames_times.items():
-                if not isinstance(frame_time, (float, int)):
-                    raise TypeError(f'frames_time["{state}"] must be a float')
-        except AttributeError:
-            raise TypeError("frames and frames_time must be dicts")  
-         
-        frame_scale = config.frame_scale
-        max_cache_size = config.max_cache_size
-        play_mode = config.play_mode
-        if not (isinstance(frame_scale, tuple) or 
-                all(isinstance(i, (int, float)) for i in frame_scale)):
-            raise TypeError("frame_scale must be a tuple of two numbers")
-        if (not isinstance(max_cache_size, int) or
-            max_cache_size < _AnimationMagicNumber.DEFAULT_MAX_CHACH_SIZE):
-            raise ValueError(
-                f"max_cache_size must be an integer greater than or equal to {
-                    _AnimationMagicNumber.DEFAULT_MAX_CHACH_SIZE
-                }"
-            )
-        if play_mode not in get_args(PlayMode):
-            raise ValueError(
-                f"Invalid play mode: {play_mode},"
-                "play mode must be one of {get_args(PlayMode)}"
-            )
-
-    def _validate_and_load_frames(self, state: str, frame_list: list) -> None:
-        """validate and load frame images from file path or pygame.Surface
-        Args:
-            state: animation state name
-            frame_list: frame image list (str or pygame.Surface)
-        Raises:
-            TypeError: Invalid frame type"""
-        for i, frame in enumerate(frame_list):
-            if not isinstance(frame, (str, pygame.Surface)):
-                raise TypeError(
-                    f'frames["{state}"][{i}] must be str, filepath or pygame.Surface, '
-                    f'got {type(frame).__name__}'
-                )
-            
-            if isinstance(frame, str) and frame not in self._image_source:
-                try:
-                    loaded_surface = pygame.image.load(frame)
-                    self._image_source[frame] = loaded_surface
-                except (pygame.error, FileNotFoundError) as e:
-                    raise ValueError(
-                        f'frames["{state}"][{i}]: '
-                        f'Cannot load image resource "{frame}" - {e}'
-                    )
-
     @staticmethod
     def _create_error_surface() -> pygame.Surface:
         """Generate error prompt image"""
@@ -882,6 +3018,189 @@ class FramePlayer(AbstractAnimationPlayer):
             ValueError: Size is less than 10
         """
         self._cache_manager.set_max_cache_size(size)
+
+    def set_cache_bytes(self, size: int) -> None:
+        """Dynamically adjust the cache memory budget
+        
+        Args:
+            size: new memory budget in bytes, 0 means no budget
+
+        Raises:
+            ValueError: Size is less than 0
+        """
+        self._cache_manager.set_max_cache_bytes(size)
+
+    def prewarm(
+        self,
+        states: Optional[Iterable[str]] = None,
+        scales: Optional[Iterable[Scale]] = None,
+        directions: Optional[Iterable[Direction]] = None,
+        angles: Optional[Iterable[float]] = None,
+        background: bool = False
+    ) -> Union[PrewarmReport, Future]:
+        """Fill the cache with every frame of the states for all combinations of the 
+        given transforms ahead of time, so that `update_frame` doesn't hitch on the first playthrough
+
+        Args:
+            states: States to prewarm, all states if None
+            scales: Scaling sizes to prewarm, the current scale if None
+            directions: Flipping directions to prewarm, the current direction if None
+            angles: Rotation angles to prewarm (quantized with angle_step), the current angle if None
+            background: Run on a worker thread and return a `Future` of the report
+
+        Returns:
+            {"surfaces": images added to the cache (intermediate stages included), "bytes": their bytes},
+            or a `concurrent.futures.Future` of it when background is True
+
+        Raises:
+            KeyError: Invalid state
+            ValueError: background with a single_threaded player
+        """
+        if background:
+            self._check_background()
+        states = list(self.frames.keys()) if states is None else list(states)
+        for state in states:
+            if state not in self.frames:
+                raise KeyError(
+                    f"Invalid state: {state}. Available states: {list(self.frames.keys())}"
+                )
+        transforms = list(product(
+            [self.frame_scale] if scales is None else [tuple(s) for s in scales],
+            [self.direction] if directions is None else [tuple(d) for d in directions],
+            [self.angle] if angles is None else [self._quantize_angle(a) for a in angles]
+        ))
+
+        if not background:
+            return self._prewarm(states, transforms)
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return executor.submit(self._prewarm, states, transforms)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _prewarm(self, 
+                 states: List[str], 
+                 transforms: List[Tuple[Scale, Direction, float]]) -> PrewarmReport:
+        """Prewarm the cache, see `prewarm`"""
+        self._assets.load_states(states)
+        frames = list(dict.fromkeys(
+            frame for state in states for frame in self.frames[state]
+        ))
+        if len(frames) * len(transforms) > self._cache_manager.max_cache_size:
+            self._logger.warning(
+                f"Prewarming {len(frames) * len(transforms)} images exceeds the cache size "
+                f"{self._cache_manager.max_cache_size}, the earliest ones will be eliminated"
+            )
+        
+        report: PrewarmReport = {"surfaces": 0, "bytes": 0}
+        for frame, (scale, direction, angle) in product(frames, transforms):
+            count, nbytes = self._cache_manager.prewarm(frame, scale, direction, angle)
+            report["surfaces"] += count
+            report["bytes"] += nbytes
+        return report
+
+    @staticmethod
+    def prewarm_many(
+        players: Iterable[FramePlayer],
+        states: Optional[Iterable[str]] = None,
+        scales: Optional[Iterable[Scale]] = None,
+        directions: Optional[Iterable[Direction]] = None,
+        angles: Optional[Iterable[float]] = None,
+        background: bool = False
+    ) -> Union[PrewarmReport, Future]:
+        """Prewarm many players at once, see `prewarm`
+
+        Args:
+            players: Players to prewarm
+            states: States to prewarm, all states of each player if None
+
+        Returns:
+            The summed report of all players, or a `Future` of it when background is True
+
+        Raises:
+            ValueError: background with a single_threaded player
+        """
+        players = list(players)
+        if background:
+            for player in players:
+                player._check_background()
+        states = None if states is None else list(states)
+        scales = None if scales is None else list(scales)
+        directions = None if directions is None else list(directions)
+        angles = None if angles is None else list(angles)
+
+        def run() -> PrewarmReport:
+            report: PrewarmReport = {"surfaces": 0, "bytes": 0}
+            for player in players:
+                player_report = player.prewarm(states, scales, directions, angles)
+                report["surfaces"] += player_report["surfaces"]
+                report["bytes"] += player_report["bytes"]
+            return report
+
+        if not background:
+            return run()
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return executor.submit(run)
+        finally:
+            executor.shutdown(wait=False)
+
+    def prefetch_states(self, 
+                        states: Iterable[str], 
+                        background: bool = False) -> Optional[Future]:
+        """Load the image files of lazy states ahead of their `set_state` (no-op without lazy_states),
+        a `set_state` during a background load waits for it instead of loading the files again
+
+        Args:
+            states: States about to be played
+            background: Load on a worker thread and return a `Future`
+
+        Raises:
+            KeyError: Invalid state
+            ValueError: An image file cannot be loaded, or background with a single_threaded player
+        """
+        if background:
+            self._check_background()
+        states = list(states)
+        for state in states:
+            if state not in self.frames:
+                raise KeyError(
+                    f"Invalid state: {state}. Available states: {list(self.frames.keys())}"
+                )
+        
+        def run() -> None:
+            # not holding the state lock, so that decoding doesn't block update_frame
+            self._assets.load_states(states)
+
+        if not background:
+            return run()
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            return executor.submit(run)
+        finally:
+            executor.shutdown(wait=False)
+
+    def _check_background(self) -> None:
+        """A single_threaded player has no locks, so it must not be used by a background worker
+
+        Raises:
+            ValueError: The player is single_threaded
+        """
+        if isinstance(self._state_lock, _NullLock):
+            raise ValueError("background=True needs a thread safe player, the player is single_threaded")
+
+    def unload_states(self, states: Iterable[str]) -> None:
+        """Unload the image files of lazy states, the states played by this player
+        or by the players sharing its frames are kept loaded"""
+        self._assets.unload_states(states)
+
+    @property
+    def loaded_states(self) -> List[str]:
+        """Return the lazy states whose image files are loaded"""
+        return list(self._assets.loaded_states)
     # endregion
 
     # region #################### Animation Control System ####################
@@ -892,12 +3211,16 @@ class FramePlayer(AbstractAnimationPlayer):
                   state: str, 
                   reset_frame: bool = True) -> None:
         """Set now playing state (delegates to state_manager)"""
-        with self._cache_manager.lock:
+        with self._state_lock:
+            self._assets.load_states([state])
             self._state_manager.set_state(state, reset_frame)
+            self._hold_state()
+            self._sync_system(reset_timer=reset_frame)
     
     def rewind(self) -> None:
         """Reset to the starting frame (delegates to state_manager)"""
         self._state_manager.rewind()
+        self._sync_system(reset_timer=True)
 
     def set_play_mode(self, mode: PlayMode) -> None:
         """Set play mode
@@ -911,6 +3234,7 @@ class FramePlayer(AbstractAnimationPlayer):
         if mode not in get_args(PlayMode):
             raise ValueError(f"Invalid play mode: {mode}")
         self.play_mode = mode
+        self._sync_system()
 
     def add_complete_callback(self, callback: Callable) -> None:
         """Add animation complete callback
@@ -927,10 +3251,29 @@ class FramePlayer(AbstractAnimationPlayer):
     def pause(self) -> None:
         """Pause animation"""
         self._state_manager.pause()
+        self._hold_state()
+        self._sync_system()
 
     def resume(self) -> None:
         """Resume playback (Resume from the current frame)"""
-        self._state_manager.resume()
+        with self._state_lock:
+            self._state_manager.resume()
+            if self._state_manager.current_state is not None:
+                self._assets.load_states([self._state_manager.current_state])
+            self._hold_state()
+        self._sync_system()
+
+    def _hold_state(self) -> None:
+        """Count the current state as played by this player in the assets, so it is not unloaded"""
+        state = self._state_manager.current_state
+        if state != self._held_state:
+            self._assets.hold_state(state, self._held_state)
+            self._held_state = state
+
+    def _sync_system(self, reset_timer: bool = False) -> None:
+        """Push the playback state to the `AnimationSystem` advancing this player, if any"""
+        if self._animation_system is not None:
+            self._animation_system._sync(self, reset_timer)
     # endregion
 
     # region #################### core update logic ####################
@@ -954,23 +3297,42 @@ class FramePlayer(AbstractAnimationPlayer):
             self.direction = direction
         if self.frame_scale != scale:
             self.frame_scale = scale
-        if self.angle != (normalized_angle := angle % 360):
+        if self.angle != (normalized_angle := self._quantize_angle(angle)):
             self.angle = normalized_angle
 
         self._state_manager.time_since_last_frame += dt
         frame_duration = self.frames_times[self._state_manager.current_state]
         
-        with self._cache_manager.lock:
+        with self._state_lock:
             if self._state_manager.time_since_last_frame >= frame_duration:
                 self._state_manager.time_since_last_frame = 0
                 self._advance_frame()
+            assets = self._assets
+            if assets.state_idle_timeout and assets.loaded_states:
+                self._lazy_clock += dt
+                assets.unload_idle_states(self._lazy_clock)
+            if assets.convert_to_display and not assets.display_format:
+                self._check_display_format()
+            if assets.hot_reload_interval and perf_counter() >= self._next_reload_check:
+                self._next_reload_check = perf_counter() + assets.hot_reload_interval
+                self.reload_changed_files()
         
         # Not using locks in the code below is to prevent lock blocking
-        if scale != self._last_scale or direction != self._last_direction:
+        if (scale != self._last_scale or 
+            direction != self._last_direction or
+            self.angle != self._last_angle):
             self._last_scale = scale
             self._last_direction = direction
+            self._last_angle = self.angle
             self._update_image()
 
+    def _quantize_angle(self, angle: float) -> float:
+        """Normalize the angle to [0, 360) and round it to a multiple of angle_step"""
+        angle %= 360
+        if self.angle_step:
+            angle = round(angle / self.angle_step) * self.angle_step % 360
+        return angle
+
     def _advance_frame(self) -> None:
         """Advance to the next frame (based on playback mode)"""
         if self._state_manager.current_state is None:
@@ -999,22 +3361,19 @@ class FramePlayer(AbstractAnimationPlayer):
 
     def _update_image(self) -> None:
         """Update the currently displayed image"""
-        with self._cache_manager.lock:
+        with self._state_lock:
             if self._state_manager.current_state is None or not self.rect:
                 return
 
             try:
-                current_frames_list: List[Union[str, pygame.Surface]] = \
+                current_frames_list: List[Frame] = \
                     self.frames[self._state_manager.current_state]
-                current_frame: Union[str, pygame.Surface] = \
+                current_frame: Frame = \
                     current_frames_list[self._state_manager.frame_index]
                 
-                if self._surface_frames:
-                    assert isinstance(current_frame, pygame.Surface)
-                    self.image = self._process_surface_frame(current_frame)
-                else:
-                    assert isinstance(current_frame, str)
-                    self.image = self._cache_manager.get_cached_image(current_frame)
+                self.image = self._cache_manager.get_image(
+                    current_frame, self.frame_scale, self.direction, self.angle
+                )
 
                 old_center = self.rect.center if self.rect else None
                 self.rect = self.image.get_rect()
@@ -1046,6 +3405,25 @@ class FramePlayer(AbstractAnimationPlayer):
     # endregion
 
     # region #################### resources management ####################
+    def reload_changed_files(self) -> List[str]:
+        """Reload the image files modified since they were loaded, and drop only the
+        cached images derived from them. A file failing to load (e.g. still being written)
+        keeps its previous image and is retried on the next call.
+
+        Returns:
+            The reloaded file paths
+        """
+        reloaded = self._assets.reload_changed_files()
+        if not reloaded:
+            return []
+        
+        with self._state_lock:
+            current_state = self._state_manager.current_state
+            if current_state is not None and \
+                self.frames[current_state][self._state_manager.frame_index] in reloaded:
+                self._update_image()
+        return reloaded
+
     def release(self) -> bool:
         """Release all resources and return whether the release operation was executed
 
@@ -1060,10 +3438,13 @@ class FramePlayer(AbstractAnimationPlayer):
             self._logger.info("Resource released (skipped safely)")
             return False
 
-        with self._cache_manager.lock:
+        with self._state_lock:
             try:
+                if self._animation_system is not None:
+                    self._animation_system.remove(self)
                 self._state_manager.release()
-                self._cache_manager.release(self.image)
+                self._hold_state()
+                self._assets.release()    # the cache and the images are released with their last user
                 self.image = None
                 self.rect = None
                 return True
@@ -1118,13 +3499,19 @@ class FramePlayer(AbstractAnimationPlayer):
 
     # region #################### debugger ####################
     @property
-    def cache_info(self) -> Dict[str, Union[int, List[str]]]:
+    def cache_info(self) -> CacheInfo:
         """Get cache state info
         
         Returns:
-            Dict containing cache size and sample keys
+            Dict containing cache size, sample keys and the counters since the last `reset_cache_stats`
+            (hits, misses, evictions, load errors, miss time in seconds and its histogram),
+            and with dedupe_frames the number of collapsed duplicate frames and the source bytes they saved
         """
-        return self._cache_manager.info
+        return self._assets.cache_info
+
+    def reset_cache_stats(self) -> None:
+        """Reset the cache counters and the miss time histogram"""
+        self._cache_manager.reset_stats()
 
     def draw_debug_info(self, 
                         surface: pygame.Surface, 
@@ -1140,6 +3527,7 @@ class FramePlayer(AbstractAnimationPlayer):
             f"State: {self.get_state() or 'None'}",
             f"Frame: {self.frame_index}",
             f"Cache: {info['cache_size']} / {info['max_size']}",
+            f"Hits: {info['hits']} Misses: {info['misses']} ({info['hit_ratio']:.0%})",
             f"PlayMode: {self.play_mode}"
         ]
         
@@ -1170,3 +3558,236 @@ class FramePlayer(AbstractAnimationPlayer):
         new_attrs = set(all_attrs) - set(dir(super()))
         return [attr for attr in sorted(new_attrs) if not attr.startswith('_')]
     # endregion
+
+class AnimationClip:
+    """Immutable, validated animation data (frames, frame times, source images and frame cache)
+    built once and shared by lightweight players, which only hold their playback state (flyweight).
+
+    ## Example:
+        clip = AnimationClip(AnimationConfig(frames, frames_times))
+        enemies = [clip.create_player() for _ in range(500)]
+    """
+
+    __slots__ = ("_assets", "_released")
+
+    def __init__(self, 
+                 config: AnimationConfig, 
+                 injection: Optional[AnimationParamInjection] = None) -> None:
+        """Validate and load the animation once, see `FramePlayer` for the parameters
+
+        Raises:
+            ValueError: When the keys of frames and frames_time do not match
+            TypeError: When the input parameter type does not meet the requirements
+        """
+        self._assets = _AnimationAssets(config, injection or AnimationParamInjection())
+        self._assets.acquire()
+        self._released = False
+
+    @property
+    def frames(self) -> MappingProxyType:
+        """Read-only view of the frames of each state"""
+        return MappingProxyType(self._assets.frames)
+
+    @property
+    def frames_times(self) -> MappingProxyType:
+        """Read-only view of the frame interval time of each state"""
+        return MappingProxyType(self._assets.frames_times)
+
+    def create_player(self) -> FramePlayer:
+        """Create a lightweight player of the clip, see `FramePlayer.from_clip`"""
+        return FramePlayer.from_clip(self)
+
+    def release(self) -> bool:
+        """Release the reference of the clip, the frame cache and images are released once
+        the players of the clip are released too
+
+        Returns:
+            False if the clip was already released
+        """
+        if self._released:
+            return False
+        self._released = True
+        self._assets.release()
+        return True
+
+class AnimationSystem:
+    """Advance the frame timers of many players in one vectorized NumPy step per tick,
+    only touching the players whose frame changes (or whose animation ends).
+
+    Timers, frame durations, frame indices, frame counts and play modes are stored in arrays,
+    so a tick costs a few array operations instead of one `update_frame` call per player.
+    The players follow the same rules as `update_frame` (at most one frame per tick, the timer
+    restarts at 0), and `set_state`, `set_play_mode`, `pause`, `resume` and `rewind` of an added
+    player are pushed to the system. Change the transform of an added player with
+    `update_frame(0, direction, scale, angle)`; lazy state unloading, hot reload and the
+    display format check only run in `update_frame`.
+
+    ## Example:
+        system = AnimationSystem(clip.create_player() for _ in range(10000))
+        while running:
+            system.update(dt)
+
+    Raises:
+        ImportError: numpy is not installed
+    """
+
+    __slots__ = (
+        "_players", "_slots", "_count",
+        "_timers", "_durations", "_indices", "_counts", "_modes", "_pingpong", "_active"
+    )
+
+    _PLAY_MODES: Final = {"loop": 0, "once": 1, "pingpong": 2}
+
+    def __init__(self, players: Iterable[FramePlayer] = ()) -> None:
+        if np is None:
+            raise ImportError("AnimationSystem requires numpy")
+        self._players: List[FramePlayer] = []
+        self._slots: Dict[FramePlayer, int] = {}
+        self._count = 0
+        self._timers = np.zeros(0, dtype=np.float64)
+        self._durations = np.zeros(0, dtype=np.float64)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._modes = np.zeros(0, dtype=np.int8)
+        self._pingpong = np.zeros(0, dtype=np.int8)
+        self._active = np.zeros(0, dtype=bool)
+        for player in players:
+            self.add(player)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, player: FramePlayer) -> bool:
+        return player in self._slots
+
+    @property
+    def players(self) -> List[FramePlayer]:
+        """The players advanced by the system"""
+        return list(self._players)
+
+    def add(self, player: FramePlayer) -> None:
+        """Advance the player with the system, its own `update_frame` must no longer get the dt
+
+        Raises:
+            ValueError: The player is released or advanced by another system
+        """
+        if player in self._slots:
+            return
+        if player._released:
+            raise ValueError("Cannot add a released player")
+        if player._animation_system is not None:
+            raise ValueError("The player is advanced by another AnimationSystem")
+
+        if self._count == len(self._timers):
+            self._grow(max(64, self._count * 2))
+        slot = self._count
+        self._players.append(player)
+        self._slots[player] = slot
+        self._count += 1
+        player._animation_system = self
+        self._sync(player, reset_timer=False)
+        self._timers[slot] = player._state_manager.time_since_last_frame
+
+    def remove(self, player: FramePlayer) -> None:
+        """Stop advancing the player, its timer is written back so `update_frame` continues from it"""
+        slot = self._slots.pop(player, None)
+        if slot is None:
+            return
+        player._state_manager.time_since_last_frame = float(self._timers[slot])
+        player._animation_system = None
+
+        # move the last player into the freed slot to keep the arrays packed
+        last = self._count - 1
+        last_player = self._players.pop()
+        if slot != last:
+            self._players[slot] = last_player
+            self._slots[last_player] = slot
+            for array in (self._timers, self._durations, self._indices,
+                          self._counts, self._modes, self._pingpong, self._active):
+                array[slot] = array[last]
+        self._count = last
+
+    def update(self, dt: float = 1/60) -> None:
+        """Advance all the players by dt seconds, the callbacks may remove or release players
+        (e.g. `kill()` on completion), a player removed during the tick is not advanced further
+
+        Args:
+            dt: Time elapsed since the previous tick (in seconds), default is 1/60
+        """
+        count = self._count
+        timers = self._timers[:count]
+        active = self._active[:count]
+        np.add(timers, dt, out=timers, where=active)
+        due = np.flatnonzero(active & (timers >= self._durations[:count]))
+        if due.size == 0:
+            return
+        timers[due] = 0.0
+
+        previous = self._indices[due]
+        counts = self._counts[due]
+        modes = self._modes[due]
+        directions = self._pingpong[due]
+
+        indices = previous + 1
+        pingpong = modes == self._PLAY_MODES["pingpong"]
+        indices[pingpong] = previous[pingpong] + directions[pingpong]
+
+        loop = modes == self._PLAY_MODES["loop"]
+        indices[loop] %= counts[loop]
+
+        finished = (modes == self._PLAY_MODES["once"]) & (indices >= counts)
+        indices[finished] = counts[finished] - 1
+
+        bounced = pingpong & ((indices < 0) | (indices >= counts))
+        directions[bounced] *= -1
+        indices[bounced] = np.clip(
+            indices[bounced] + directions[bounced] * 2, 0, counts[bounced] - 1
+        )
+        self._indices[due] = indices
+        self._pingpong[due] = directions
+
+        changed = indices != previous
+        ended = finished | bounced
+        touched = np.flatnonzero(changed | ended)
+        # resolved before any callback runs, a callback may remove players (e.g. kill()) and move the slots
+        players = [self._players[slot] for slot in due[touched].tolist()]
+        for player, index, direction, end, change in zip(
+            players, indices[touched].tolist(), directions[touched].tolist(),
+            ended[touched].tolist(), changed[touched].tolist()
+        ):
+            if player._animation_system is not self:
+                continue    # removed by a callback earlier in this tick
+            with player._state_lock:
+                state_manager = player._state_manager
+                state_manager.frame_index = index
+                state_manager.time_since_last_frame = 0
+                player._pingpong_direction = direction
+                if end:
+                    state_manager.handle_animation_end()
+                    if player.play_mode == "once":
+                        player.pause()
+                if change:
+                    player._update_image()
+
+    def _sync(self, player: FramePlayer, reset_timer: bool) -> None:
+        """Copy the playback state of the player to its slot"""
+        slot = self._slots[player]
+        state_manager = player._state_manager
+        state = state_manager.current_state
+        self._active[slot] = state is not None
+        if state is not None:
+            self._durations[slot] = player.frames_times[state]
+            self._counts[slot] = len(player.frames[state])
+        self._indices[slot] = state_manager.frame_index
+        self._modes[slot] = self._PLAY_MODES[player.play_mode]
+        self._pingpong[slot] = player._pingpong_direction
+        if reset_timer:
+            self._timers[slot] = state_manager.time_since_last_frame
+
+    def _grow(self, capacity: int) -> None:
+        """Resize the arrays to the capacity"""
+        for name in ("_timers", "_durations", "_indices", "_counts", "_modes", "_pingpong", "_active"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
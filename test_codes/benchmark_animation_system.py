@@ -0,0 +1,69 @@
+"""
+Compare the cost of a tick for many players advanced one by one with update_frame
+and all at once with AnimationSystem.update.
+
+Run with: python benchmark_animation_system.py (requires numpy)
+"""
+
+import os
+from time import perf_counter
+from typing import List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from animation import AnimationClip, AnimationConfig, AnimationParamInjection, AnimationSystem, FramePlayer
+from benchmark_common import SilentLogger, make_frames
+
+PLAYER_COUNTS = (1000, 10000)
+TICKS = 60
+DT = 1 / 60
+
+
+def make_players(clip: AnimationClip, count: int) -> List[FramePlayer]:
+    players = [clip.create_player() for _ in range(count)]
+    # spread the states and timers so frames change on different ticks, as with real units
+    for index, player in enumerate(players):
+        player.set_state(("idle", "walk", "attack")[index % 3])
+        player.update_frame((index % 7) * 0.013)
+    return players
+
+
+def time_per_tick(players: List[FramePlayer], system: AnimationSystem = None) -> float:
+    start = perf_counter()
+    for _ in range(TICKS):
+        if system is not None:
+            system.update(DT)
+        else:
+            for player in players:
+                player.update_frame(DT)
+    return (perf_counter() - start) / TICKS
+
+
+def main() -> None:
+    pygame.init()
+    clip = AnimationClip(
+        AnimationConfig(
+            frames=make_frames(("idle", "walk", "attack"), 6, (16, 16)),
+            frames_times={"idle": 0.15, "walk": 0.1, "attack": 0.08},
+            single_threaded=True
+        ),
+        AnimationParamInjection(logger_instance=SilentLogger())
+    )
+    print(f"{TICKS} ticks of {DT * 1e3:.1f} ms")
+    print("players  update_frame   AnimationSystem   speedup   (ms/tick)")
+    for count in PLAYER_COUNTS:
+        players = make_players(clip, count)
+        looped = time_per_tick(players)
+        system = AnimationSystem(players)
+        batched = time_per_tick(players, system)
+        print(f"{count:<9}{looped * 1e3:>12.2f}{batched * 1e3:>18.2f}{looped / batched:>9.1f}x")
+        for player in players:
+            player.release()
+    clip.release()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measure frame cache throughput when several threads update many players at once.
+
+Every thread owns a slice of the players and keeps switching their direction and
+scale, so the cache sees a mix of lock free hits and concurrent misses. With
+shared_cache enabled all players also contend on the process-wide shared cache.
+
+Run with: python benchmark_cache_contention.py
+"""
+
+import os
+import threading
+from time import perf_counter
+from typing import List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from animation import AnimationConfig, AnimationParamInjection, FramePlayer
+from benchmark_common import SilentLogger, make_frames
+
+PLAYER_COUNT = 64
+THREAD_COUNTS = (1, 2, 4, 8)
+UPDATES_PER_PLAYER = 400
+SCALES = ((32, 32), (48, 48), (64, 64))
+
+
+def make_players(shared_cache: bool) -> List[FramePlayer]:
+    frames = make_frames(("idle", "walk", "run"), 6, (32, 32))
+    return [
+        FramePlayer(
+            AnimationConfig(
+                frames=frames,
+                frames_times={"idle": 0.1, "walk": 0.1, "run": 0.1},
+                max_cache_size=64,
+                shared_cache=shared_cache
+            ),
+            AnimationParamInjection(logger_instance=SilentLogger())
+        )
+        for _ in range(PLAYER_COUNT)
+    ]
+
+
+def drive(players: List[FramePlayer]) -> None:
+    for step in range(UPDATES_PER_PLAYER):
+        for index, player in enumerate(players):
+            if step % 50 == 0:
+                player.set_state(("idle", "walk", "run")[(step // 50 + index) % 3])
+            player.update_frame(
+                0.05,
+                ((step + index) % 2 == 0, False),
+                SCALES[(step // 20 + index) % len(SCALES)]
+            )
+
+
+def run(thread_count: int, shared_cache: bool) -> float:
+    players = make_players(shared_cache)
+    threads = [
+        threading.Thread(target=drive, args=(players[i::thread_count],))
+        for i in range(thread_count)
+    ]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - start
+    for player in players:
+        player.release()
+    return PLAYER_COUNT * UPDATES_PER_PLAYER / elapsed
+
+
+def main() -> None:
+    pygame.init()
+    print(f"{PLAYER_COUNT} players, {UPDATES_PER_PLAYER} updates each")
+    print("threads  private cache  shared cache   (updates/s)")
+    for thread_count in THREAD_COUNTS:
+        private = run(thread_count, shared_cache=False)
+        shared = run(thread_count, shared_cache=True)
+        print(f"{thread_count:<9}{private:>13,.0f}{shared:>14,.0f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
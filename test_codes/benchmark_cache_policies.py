@@ -0,0 +1,100 @@
+"""
+Compare the hit ratios of the frame cache eviction policies ("lru", "lfu", "arc", "clock")
+on synthetic but realistic state switching traces.
+
+Run with: python benchmark_cache_policies.py
+"""
+
+import random
+from typing import List, Tuple
+
+import pygame
+
+from animation import _CacheManagerDeps, _FrameCacheManager
+from benchmark_common import SilentLogger
+
+POLICIES = ("lru", "lfu", "arc", "clock")
+CACHE_SIZES = (32, 48, 64)
+TRACE_LENGTH = 20000
+
+Access = Tuple[str, Tuple[bool, bool]]    # (frame name, direction)
+
+
+def play(state: str, frame_count: int, direction: Tuple[bool, bool], loops: int = 1) -> List[Access]:
+    return [
+        (f"{state}_{i}", direction)
+        for _ in range(loops)
+        for i in range(frame_count)
+    ]
+
+
+def hot_loops_with_one_shots(rng: random.Random) -> List[Access]:
+    """A few hot looping states (idle/walk/run, facing left or right) interrupted by
+    rarely repeated one-shot states (attacks, emotes, cutscenes) that scan the cache"""
+    hot_states = {"idle": 8, "walk": 8, "run": 8}
+    one_shots = {f"oneshot{i}": rng.randint(12, 40) for i in range(30)}
+    trace: List[Access] = []
+    while len(trace) < TRACE_LENGTH:
+        if rng.random() < 0.15:
+            state = rng.choice(list(one_shots))
+            trace += play(state, one_shots[state], (False, False))
+        else:
+            state = rng.choice(list(hot_states))
+            trace += play(state, hot_states[state], (rng.random() < 0.5, False), rng.randint(1, 4))
+    return trace[:TRACE_LENGTH]
+
+
+def skewed_state_switching(rng: random.Random) -> List[Access]:
+    """Many states chosen with a Zipf-like popularity, each played for a loop or two"""
+    states = [(f"state{i}", rng.randint(4, 16)) for i in range(20)]
+    weights = [1 / (rank + 1) for rank in range(len(states))]
+    trace: List[Access] = []
+    while len(trace) < TRACE_LENGTH:
+        state, frame_count = rng.choices(states, weights)[0]
+        trace += play(state, frame_count, (rng.random() < 0.5, False), rng.randint(1, 2))
+    return trace[:TRACE_LENGTH]
+
+
+def hit_ratio(policy: str, cache_size: int, trace: List[Access]) -> float:
+    current = {"direction": (False, False)}
+    misses = 0
+
+    cache = _FrameCacheManager(
+        _CacheManagerDeps(
+            max_cache_size=cache_size,
+            max_cache_bytes=0,
+            cache_policy=policy,
+            max_cold_bytes=0,
+            get_scale=lambda: (0, 0),
+            get_direction=lambda: current["direction"],
+            get_angle=lambda: 0.0,
+            get_source_image=lambda frame: pygame.Surface((1, 1)),
+            process_image=lambda *args: pygame.Surface((1, 1)),
+            transform_image=lambda img, *args: pygame.Surface((1, 1)),
+            create_error_surface=lambda: pygame.Surface((1, 1)),
+            logger=SilentLogger()
+        )
+    )
+    for frame, direction in trace:
+        current["direction"] = direction
+        if (frame, (0, 0), direction, 0.0) not in cache.image_cache:
+            misses += 1
+        cache.get_cached_image(frame)
+    return 1 - misses / len(trace)
+
+
+def main() -> None:
+    traces = {
+        "hot loops + one-shots": hot_loops_with_one_shots(random.Random(1)),
+        "skewed state switching": skewed_state_switching(random.Random(2)),
+    }
+    for name, trace in traces.items():
+        print(f"\n{name} ({len(trace)} frame changes)")
+        print("size  " + "".join(f"{policy:>8}" for policy in POLICIES))
+        for cache_size in CACHE_SIZES:
+            ratios = [hit_ratio(policy, cache_size, trace) for policy in POLICIES]
+            print(f"{cache_size:<6}" + "".join(f"{ratio:>8.1%}" for ratio in ratios))
+
+
+if __name__ == "__main__":
+    main()
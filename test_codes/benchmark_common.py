@@ -0,0 +1,33 @@
+"""
+Helpers shared by the benchmark_*.py scripts: a logger that drops every message
+and a factory of solid color frames.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+from animation import AbstractLogger
+
+
+class SilentLogger(AbstractLogger):
+    def debug(self, message: str) -> None: pass
+    def info(self, message: str) -> None: pass
+    def warning(self, message: str) -> None: pass
+    def error(self, message: str) -> None: pass
+    def critical(self, message: str) -> None: pass
+
+
+def make_frames(states: Iterable[str],
+                frame_count: int,
+                size: Tuple[int, int]) -> Dict[str, List[pygame.Surface]]:
+    """Create frame_count solid color SRCALPHA frames of the size for each state,
+    every frame of every state has a different color"""
+    frames = {}
+    for state_index, state in enumerate(states):
+        frames[state] = []
+        for i in range(frame_count):
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill((i * 40 % 256, state_index * 60 % 256, 200, 255))
+            frames[state].append(surface)
+    return frames
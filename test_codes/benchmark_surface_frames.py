@@ -0,0 +1,87 @@
+"""
+Measure the construction time and the peak RSS of surface-mode players built from a
+large frame set, with the frames copied (default) and referenced (copy_surface_frames=False).
+
+Every mode runs in a fresh interpreter so the peak RSS of one does not hide the other.
+Peak RSS comes from the resource module, so this benchmark needs a Unix-like system.
+
+Run with: python benchmark_surface_frames.py
+"""
+
+import os
+import resource
+import subprocess
+import sys
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from animation import AnimationConfig, AnimationParamInjection, FramePlayer
+from benchmark_common import SilentLogger, make_frames
+
+STATE_COUNT = 8
+FRAMES_PER_STATE = 32
+FRAME_SIZE = (256, 256)
+PLAYER_COUNT = 4
+MODES = ("copy", "reference")
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_mode(mode: str) -> None:
+    """Child process: build the players and print 'seconds peak_before_mb peak_after_mb'"""
+    pygame.init()
+    frames = make_frames(
+        [f"state{state}" for state in range(STATE_COUNT)], FRAMES_PER_STATE, FRAME_SIZE
+    )
+    frames_times = {state: 0.1 for state in frames}
+    before = peak_rss_mb()
+
+    start = perf_counter()
+    players = [
+        FramePlayer(
+            AnimationConfig(
+                frames=frames,
+                frames_times=frames_times,
+                copy_surface_frames=(mode == "copy")
+            ),
+            AnimationParamInjection(logger_instance=SilentLogger())
+        )
+        for _ in range(PLAYER_COUNT)
+    ]
+    elapsed = perf_counter() - start
+    after = peak_rss_mb()
+
+    for player in players:
+        player.release()
+    pygame.quit()
+    print(f"{elapsed} {before} {after}")
+
+
+def main() -> None:
+    frame_mb = FRAME_SIZE[0] * FRAME_SIZE[1] * 4 / (1024 * 1024)
+    print(
+        f"{PLAYER_COUNT} players, {STATE_COUNT} states x {FRAMES_PER_STATE} frames of "
+        f"{FRAME_SIZE[0]}x{FRAME_SIZE[1]} ({STATE_COUNT * FRAMES_PER_STATE * frame_mb:.0f} MB of frames)"
+    )
+    print("mode        construction   peak RSS   RSS added by players")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), mode],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        elapsed, before, after = (float(value) for value in output[-3:])
+        print(f"{mode:<12}{elapsed * 1e3:>9.1f} ms{after:>8.0f} MB{after - before:>14.0f} MB")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_mode(sys.argv[1])
+    else:
+        main()